@@ -1,3 +1,4 @@
+import copy
 import datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
@@ -22,7 +23,58 @@ if TYPE_CHECKING:
     from channels.ota.schemas import OtaReservation, OtaReservationPrice, OtaReservationRoom
 
 
-@attr.s
+# Pairs of (entity field, OTA schema field) copied as is by the update() methods.
+# They don't take part in the change detection, so values are assigned without comparison.
+_DAY_UPDATE_MAPPING = (('day', 'day'), ('tax', 'tax'), ('currency', 'currency'))
+_ROOM_UPDATE_MAPPING = (
+    ('channel_id', 'channel_id'),
+    ('rate_plan_id', 'rate_plan_id'),
+    ('policy', 'policy'),
+    ('external_name', 'external_name'),
+    ('guest_name', 'guest_name'),
+    ('guest_count', 'guest_count'),
+    ('adults', 'adults'),
+    ('children', 'children'),
+    ('max_children', 'max_children'),
+    ('extra_bed', 'extra_bed'),
+    ('with_breakfast', 'with_breakfast'),
+    ('currency', 'currency'),
+    ('price', 'price'),
+    ('tax', 'tax'),
+    ('fees', 'fees'),
+    ('netto_price', 'netto_price'),
+    ('notes_extra', 'notes_extra'),
+    ('notes_facilities', 'notes_facilities'),
+    ('notes_info', 'notes_info'),
+    ('notes_meal', 'notes_meal'),
+)
+_RESERVATION_UPDATE_MAPPING = (
+    ('booked_at', 'booking_date'),
+    ('status', 'status'),
+    ('room_count', 'room_count'),
+    ('currency', 'currency'),
+    ('price', 'price'),
+    ('tax', 'tax'),
+    ('fees', 'fees'),
+    ('netto_price', 'netto_price'),
+    ('promo', 'promo'),
+    ('payment_info', 'payment_info'),
+)
+_RESERVATION_GUEST_UPDATE_MAPPING = (
+    ('guest_name', 'name'),
+    ('guest_surname', 'surname'),
+    ('guest_email', 'email'),
+    ('guest_phone', 'phone'),
+    ('guest_country', 'country'),
+    ('guest_city', 'city'),
+    ('guest_nationality', 'nationality'),
+    ('guest_address', 'address'),
+    ('guest_comments', 'comments'),
+    ('guest_post_code', 'post_code'),
+)
+
+
+@attr.s(slots=True)
 class ReservationDay:
     id: Optional[int] = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)))
     reservation_room_id: Optional[int] = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)))
@@ -69,15 +121,12 @@ class ReservationDay:
         if self.price_changed != data.price:
             self.price_changed = data.price
             is_changed = True
-        mapping = {'day': 'day', 'tax': 'tax', 'currency': 'currency'}
-        for field, source in mapping.items():
-            value = getattr(data, source)
-            if getattr(self, field) != value:
-                setattr(self, field, value)
+        for field, source in _DAY_UPDATE_MAPPING:
+            setattr(self, field, getattr(data, source))
         return is_changed
 
 
-@attr.s
+@attr.s(slots=True)
 class ReservationRoom:
     id: Optional[int] = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)))
     reservation_id: Optional[int] = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)))
@@ -125,13 +174,7 @@ class ReservationRoom:
     notes_info: str = attr.ib(default='', validator=attr.validators.instance_of(str))
     notes_meal: str = attr.ib(default='', validator=attr.validators.instance_of(str))
 
-    day_prices: List[ReservationDay] = attr.ib(
-        default=attr.Factory(list),
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(ReservationDay),
-            iterable_validator=attr.validators.instance_of(list),
-        ),
-    )
+    day_prices: List[ReservationDay] = attr.ib(default=attr.Factory(list), validator=attr.validators.instance_of(list))
 
     # Read-Only
     checkin_original: Optional[datetime.date] = attr.ib(
@@ -208,38 +251,15 @@ class ReservationRoom:
         if self.channel_rate_id != data.channel_rate_id:
             self.channel_rate_id = data.channel_rate_id
             is_changed = True
-        mapping = {
-            'channel_id': 'channel_id',
-            'rate_plan_id': 'rate_plan_id',
-            'policy': 'policy',
-            'external_name': 'external_name',
-            'guest_name': 'guest_name',
-            'guest_count': 'guest_count',
-            'adults': 'adults',
-            'children': 'children',
-            'max_children': 'max_children',
-            'extra_bed': 'extra_bed',
-            'with_breakfast': 'with_breakfast',
-            'currency': 'currency',
-            'price': 'price',
-            'tax': 'tax',
-            'fees': 'fees',
-            'netto_price': 'netto_price',
-            'notes_extra': 'notes_extra',
-            'notes_facilities': 'notes_facilities',
-            'notes_info': 'notes_info',
-            'notes_meal': 'notes_meal',
-        }
-        for field, source in mapping.items():
-            value = getattr(data, source)
-            if getattr(self, field) != value:
-                setattr(self, field, value)
+        for field, source in _ROOM_UPDATE_MAPPING:
+            setattr(self, field, getattr(data, source))
 
         existed_prices = {x.day: x for x in self.day_prices}
         prices = []
         for price_data in data.day_prices:
-            if price_data.day in existed_prices:
-                price = attr.evolve(existed_prices[price_data.day])
+            existed_price = existed_prices.get(price_data.day)
+            if existed_price is not None:
+                price = copy.copy(existed_price)
                 is_price_changed = price.update(price_data)
             else:
                 price = ReservationDay.load(self.id, price_data)
@@ -251,7 +271,7 @@ class ReservationRoom:
         return is_changed
 
 
-@attr.s
+@attr.s(slots=True)
 class Reservation:
     id: Optional[int] = attr.ib(validator=attr.validators.optional(attr.validators.instance_of(int)))
     house_id: int = attr.ib(validator=attr.validators.instance_of(int))
@@ -305,12 +325,7 @@ class Reservation:
     guest_contact_id: Optional[int] = attr.ib(
         default=None, validator=attr.validators.optional(attr.validators.instance_of(int))
     )
-    guest_contact_ids: List[int] = attr.ib(
-        default=attr.Factory(list),
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(int), iterable_validator=attr.validators.instance_of(list)
-        ),
-    )
+    guest_contact_ids: List[int] = attr.ib(default=attr.Factory(list), validator=attr.validators.instance_of(list))
 
     promo: str = attr.ib(default='', validator=attr.validators.instance_of(str))
     payment_info: str = attr.ib(default='', validator=attr.validators.instance_of(str))
@@ -333,13 +348,7 @@ class Reservation:
         default=None, validator=attr.validators.optional(attr.validators.instance_of(int))
     )
 
-    rooms: List[ReservationRoom] = attr.ib(
-        default=attr.Factory(list),
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(ReservationRoom),
-            iterable_validator=attr.validators.instance_of(list),
-        ),
-    )
+    rooms: List[ReservationRoom] = attr.ib(default=attr.Factory(list), validator=attr.validators.instance_of(list))
 
     class Meta:
         name = 'Reservation'
@@ -374,14 +383,10 @@ class Reservation:
         return f"{self.checkin.strftime('%d.%b')}-{self.checkout.strftime('%d.%b')}, {self.get_guest_name()}"
 
     def get_total_adults(self) -> int:
-        if not self.rooms:
-            return 0
-        return sum([x.adults or 0 for x in self.rooms])
+        return sum(x.adults or 0 for x in self.rooms)
 
     def get_total_children(self) -> int:
-        if not self.rooms:
-            return 0
-        return sum([x.children or 0 for x in self.rooms])
+        return sum(x.children or 0 for x in self.rooms)
 
     def is_ota(self) -> bool:
         return self.source != ReservationSources.MANUAL
@@ -421,8 +426,7 @@ class Reservation:
             result.guest_post_code = data.guest.post_code
         if data.creditcard_info is not None:
             # Update only not empty values
-            creditcard_info = {k: v for k, v in data.creditcard_info.dict().items() if v != ''}
-            result.creditcard_info.update(creditcard_info)
+            result.creditcard_info.update((k, v) for k, v in data.creditcard_info if v != '')
         if data.rooms:
             for room in data.rooms:
                 result.rooms.append(ReservationRoom.load(result.id, room))
@@ -437,39 +441,12 @@ class Reservation:
             self.checkout = data.checkout
             is_changed = True
 
-        mapping = {
-            'booked_at': 'booking_date',
-            'status': 'status',
-            'room_count': 'room_count',
-            'currency': 'currency',
-            'price': 'price',
-            'tax': 'tax',
-            'fees': 'fees',
-            'netto_price': 'netto_price',
-            'promo': 'promo',
-            'payment_info': 'payment_info',
-        }
-        for field, source in mapping.items():
-            value = getattr(data, source)
-            if getattr(self, field) != value:
-                setattr(self, field, value)
-
-        guest_mapping = {
-            'guest_name': 'name',
-            'guest_surname': 'surname',
-            'guest_email': 'email',
-            'guest_phone': 'phone',
-            'guest_country': 'country',
-            'guest_city': 'city',
-            'guest_nationality': 'nationality',
-            'guest_address': 'address',
-            'guest_comments': 'comments',
-            'guest_post_code': 'post_code',
-        }
-        for field, source in guest_mapping.items():
-            value = getattr(data.guest, source) if data.guest is not None else ''
-            if getattr(self, field) != value:
-                setattr(self, field, value)
+        for field, source in _RESERVATION_UPDATE_MAPPING:
+            setattr(self, field, getattr(data, source))
+
+        guest = data.guest
+        for field, source in _RESERVATION_GUEST_UPDATE_MAPPING:
+            setattr(self, field, getattr(guest, source) if guest is not None else '')
 
         if data.creditcard_info is not None:
             value = data.creditcard_info.dict()
@@ -481,8 +458,9 @@ class Reservation:
         existed_rooms = {x.external_id: x for x in self.rooms}
         rooms = []
         for room_data in data.rooms:
-            if room_data.external_id in existed_rooms:
-                room = attr.evolve(existed_rooms[room_data.external_id])
+            existed_room = existed_rooms.get(room_data.external_id)
+            if existed_room is not None:
+                room = copy.copy(existed_room)
                 is_room_changed = room.update(room_data)
             else:
                 room = ReservationRoom.load(self.id, room_data)
@@ -1,7 +1,10 @@
 import datetime
 from typing import Union
 
+import inject
+
 from board import tasks
+from board.repositories import OccupancyRepo
 from board.value_objects import ReservationCancelEvent, ReservationCreateEvent, ReservationUpdateEvent
 from channels import tasks as channel_tasks
 from events import EventListener
@@ -26,13 +29,33 @@ class OccupancyHandler(EventListener):
         if house_id is None:
             return
         # Background operations
-        channel_tasks.update_inventory.delay(
-            hid=house_id, start_date=start_date, end_date=end_date, request_id=request_id
-        )
+        self.push_inventory(house_id, start_date, end_date, request_id)
         # At moment operations
         tasks.calculate_occupancy(hid=house_id, rid=roomtype_id, start_date=start_date, end_date=end_date)
         tasks.update_reservations(hid=house_id, pk=pk)
 
+    @staticmethod
+    @inject.autoparams('occupancy_repo')
+    def push_inventory(
+        house_id: int,
+        start_date: Union[datetime.date, str, None],
+        end_date: Union[datetime.date, str, None],
+        request_id: str = None,
+        *,
+        occupancy_repo: OccupancyRepo,
+    ) -> None:
+        """Push inventory to OTA at once, queue events of the following burst for one delayed push"""
+        if occupancy_repo.start_inventory_update(house_id, tasks.INVENTORY_UPDATE_DELAY):
+            channel_tasks.update_inventory.delay(
+                hid=house_id, start_date=start_date, end_date=end_date, request_id=request_id
+            )
+            return
+        if occupancy_repo.queue_inventory_update(
+            house_id, start_date, end_date, request_id, tasks.INVENTORY_FLUSH_TIMEOUT
+        ):
+            # No push is scheduled yet, the scheduled one covers everything queued until it runs
+            tasks.flush_inventory_update.apply_async(args=(house_id,), countdown=tasks.INVENTORY_UPDATE_DELAY)
+
 
 class ReservationCreateHandler(EventListener):
     listens_for = [ReservationCreateEvent]
@@ -1,5 +1,7 @@
 import datetime
-from typing import Dict, List, Optional, Union
+import functools
+import json
+from typing import Dict, List, Optional, Tuple, Union
 
 from django_redis import get_redis_connection
 from redis import Redis
@@ -16,18 +18,54 @@ class OccupancyRepoRedis(OccupancyRepo):
     def get(
         self, house_id: int, roomtype_id: int, dates: Union[datetime.date, List[datetime.date]],
     ) -> Dict[datetime.date, Optional[int]]:
-        if isinstance(dates, datetime.date):
+        if type(dates) is not list:  # all callers pass a list, single day is the rare case
+            if not isinstance(dates, datetime.date):
+                raise AssertionError("Wrong input for OccupancyRepo.get")
             dates = [dates]
-        if not isinstance(dates, list):
-            raise AssertionError("Wrong input for OccupancyRepo.get")
         name = cache_keys.occupancy(house_id, roomtype_id)
         result = self.get_store().hmget(name, [self.format_date(x) for x in dates])
         return {x: cf.get_int_or_none(y) for x, y in zip(dates, result)}
 
+    def start_inventory_update(self, house_id: int, timeout: int) -> bool:
+        return bool(self.get_store().set(cache_keys.inventory_update(house_id), 1, nx=True, ex=timeout))
+
+    def queue_inventory_update(
+        self,
+        house_id: int,
+        start_date: Union[datetime.date, str, None],
+        end_date: Union[datetime.date, str, None],
+        request_id: Optional[str],
+        timeout: int,
+    ) -> bool:
+        # Queue has no TTL, events are dropped only after push. Schedule flag expires to recover a lost push.
+        pipe = self.get_store().pipeline()
+        pipe.rpush(
+            cache_keys.inventory_update_pending(house_id), json.dumps([start_date, end_date, request_id], default=str)
+        )
+        pipe.set(cache_keys.inventory_update_scheduled(house_id), 1, nx=True, ex=timeout)
+        __, is_scheduled = pipe.execute()
+        return bool(is_scheduled)
+
+    def select_inventory_updates(self, house_id: int) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        events = self.get_store().lrange(cache_keys.inventory_update_pending(house_id), 0, -1)
+        return [tuple(json.loads(x)) for x in events]
+
+    def complete_inventory_update(self, house_id: int, count: int, timeout: int) -> bool:
+        store = self.get_store()
+        pipe = store.pipeline()
+        pipe.ltrim(cache_keys.inventory_update_pending(house_id), count, -1)
+        pipe.delete(cache_keys.inventory_update_scheduled(house_id))
+        pipe.llen(cache_keys.inventory_update_pending(house_id))
+        __, __, size = pipe.execute()
+        if not size:
+            return False
+        return bool(store.set(cache_keys.inventory_update_scheduled(house_id), 1, nx=True, ex=timeout))
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_store() -> Redis:
         return get_redis_connection("default")
 
     @staticmethod
     def format_date(value: datetime.date) -> str:
-        return value.strftime("%Y-%m-%d")
+        return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"  # same as strftime("%Y-%m-%d"), but faster
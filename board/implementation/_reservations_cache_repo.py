@@ -1,3 +1,4 @@
+import functools
 from typing import List
 
 from django_redis import get_redis_connection
@@ -7,20 +8,55 @@ from pydantic import ValidationError
 
 from board.repositories import ReservationsCacheRepo
 from board.value_objects import CachedReservation
-from common import cache_keys
+from common import cache_keys, functions as cf
 from common.loggers import Logger
 
 
+SCAN_BATCH_SIZE = 500
+
+# Member of the house index which marks it as built. It lives and dies with the index itself,
+# so an evicted or flushed index is always rebuilt, and the index never gets empty.
+INDEX_BUILT_MARKER = b"__built__"
+
+# Remove index members (KEYS[2:]) from the index (KEYS[1]) only if their value is still absent,
+# so a save() that re-adds the key between MGET and the cleanup is never undone.
+PRUNE_INDEX_SCRIPT = """
+local removed = 0
+for i = 2, #KEYS do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        removed = removed + redis.call('SREM', KEYS[1], KEYS[i])
+    end
+end
+return removed
+"""
+
+
 class ReservationsCacheRepoRedis(ReservationsCacheRepo):
     def search(self, house_id: int) -> List[CachedReservation]:
         result = []
         store = self.get_store()
-        for key in store.keys(cache_keys.reservation(house_id, "*")):
-            try:
-                data = store.get(key).decode("utf8")
-                result.append(CachedReservation.parse_raw(data))
-            except ValidationError as err:
-                Logger.warning(__name__, f"Error decode Cache Reservation [{key}] : {err}")
+        index = cache_keys.reservations_index(house_id)
+        pipe = store.pipeline()
+        pipe.sismember(index, INDEX_BUILT_MARKER)
+        pipe.smembers(index)
+        is_built, keys = pipe.execute()
+        if not is_built:
+            self.build_index(store, house_id)
+            keys = store.smembers(index)
+        keys = [x for x in keys if x != INDEX_BUILT_MARKER]
+        missed = []
+        for i in range(0, len(keys), SCAN_BATCH_SIZE):
+            chunk = keys[i : i + SCAN_BATCH_SIZE]
+            for key, data in zip(chunk, store.mget(chunk)):
+                if not data:
+                    missed.append(key)  # key was removed outside of the repo
+                    continue
+                try:
+                    result.append(CachedReservation.parse_obj(cf.json_loads(data)))
+                except (ValueError, ValidationError) as err:
+                    Logger.warning(__name__, f"Error decode Cache Reservation [{key}] : {err}")
+        if missed:
+            store.eval(PRUNE_INDEX_SCRIPT, len(missed) + 1, index, *missed)
         return result
 
     def get(self, house_id: int, pk: str) -> Maybe[CachedReservation]:
@@ -29,21 +65,43 @@ class ReservationsCacheRepoRedis(ReservationsCacheRepo):
         if data is None or not data:
             return Nothing
         try:
-            return Some(CachedReservation.parse_raw(data))
-        except ValidationError as err:
+            return Some(CachedReservation.parse_obj(cf.json_loads(data)))
+        except (ValueError, ValidationError) as err:
             Logger.warning(__name__, f"Error decode Cache Reservation [{key}] : {err}")
         return Nothing
 
     def save(self, house_id: int, reservation: CachedReservation) -> bool:
         key = cache_keys.reservation(house_id, reservation.pk)
-        return self.get_store().set(key, reservation.json())
+        store = self.get_store()
+        pipe = store.pipeline()
+        pipe.set(key, reservation.json())
+        pipe.sadd(cache_keys.reservations_index(house_id), key)
+        pipe.sismember(cache_keys.reservations_index(house_id), INDEX_BUILT_MARKER)
+        is_saved, __, is_built = pipe.execute()
+        if not is_built:
+            self.build_index(store, house_id)
+        return is_saved
 
     def delete(self, house_id: int, reservation_id: int) -> None:
         pattern = cache_keys.reservation(house_id, f"{reservation_id}-*")
         store = self.get_store()
-        for key in store.keys(pattern):
-            store.delete(key)
+        index = cache_keys.reservations_index(house_id)
+        if not store.sismember(index, INDEX_BUILT_MARKER):
+            self.build_index(store, house_id)
+        keys = list(store.sscan_iter(index, match=pattern, count=SCAN_BATCH_SIZE))
+        if keys:
+            pipe = store.pipeline()
+            pipe.delete(*keys)
+            pipe.srem(index, *keys)
+            pipe.execute()
+
+    @staticmethod
+    def build_index(store: Redis, house_id: int) -> None:
+        """Fill the house index (SET of cached reservation keys) from keyspace and mark it as built"""
+        keys = list(store.scan_iter(match=cache_keys.reservation(house_id, "*"), count=SCAN_BATCH_SIZE))
+        store.sadd(cache_keys.reservations_index(house_id), *keys, INDEX_BUILT_MARKER)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_store() -> Redis:
         return get_redis_connection("default")
@@ -1,7 +1,9 @@
+import collections
 import datetime
 from typing import Dict, List, TYPE_CHECKING, Tuple
 
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Count, F, Prefetch
 from django.utils import timezone
 from returns.maybe import Maybe, Nothing, Some
 
@@ -17,12 +19,94 @@ if TYPE_CHECKING:
     from channels.entities import Connection
 
 
+# Enum values are stored by name, lookup tables for converting DB rows
+_CHANNELS_BY_NAME = {x.name: x for x in Channels}
+_CLOSE_REASONS_BY_NAME = {x.name: x for x in RoomCloseReasons}
+_SOURCES_BY_NAME = {x.name: x for x in ReservationSources}
+_STATUSES_BY_NAME = {x.name: x for x in ReservationStatuses}
+
+# Pairs of (model field, entity field) updated by save() of existed reservation
+_RESERVATION_UPDATE_MAPPING = (
+    ('status', 'status'),
+    ('checkin', 'checkin'),
+    ('checkout', 'checkout'),
+    ('room_count', 'room_count'),
+    ('currency', 'currency'),
+    ('tax', 'tax'),
+    ('fees', 'fees'),
+    ('guest_name', 'guest_name'),
+    ('guest_surname', 'guest_surname'),
+    ('guest_email', 'guest_email'),
+    ('guest_phone', 'guest_phone'),
+    ('guest_country', 'guest_country'),
+    ('guest_nationality', 'guest_nationality'),
+    ('guest_city', 'guest_city'),
+    ('guest_address', 'guest_address'),
+    ('guest_post_code', 'guest_post_code'),
+    ('guest_comments', 'guest_comments'),
+    ('promo', 'promo'),
+    ('creditcard_info', 'creditcard_info'),
+    ('payment_info', 'payment_info'),
+    ('close_reason', 'close_reason'),
+    ('guest_contact_id', 'guest_contact_id'),
+    ('guest_contact_ids', 'guest_contact_ids'),
+    ('opportunity_id', 'opportunity_id'),
+    ('quotation_id', 'quotation_id'),
+)
+_RESERVATION_UPDATE_MAPPING_ACCEPTED = _RESERVATION_UPDATE_MAPPING + (
+    ('checkin_original', 'checkin'),
+    ('checkout_original', 'checkout'),
+    ('price_accepted', 'price_accepted'),
+    ('netto_price_accepted', 'netto_price_accepted'),
+)
+_RESERVATION_UPDATE_MAPPING_CHANGED = _RESERVATION_UPDATE_MAPPING + (('price', 'price'), ('netto_price', 'netto_price'))
+
+_ROOM_UPDATE_MAPPING = (
+    ('channel_rate_id_changed', 'channel_rate_id'),
+    ('external_name', 'external_name'),
+    ('checkin', 'checkin'),
+    ('checkout', 'checkout'),
+    ('rate_plan_id', 'rate_plan_id'),
+    ('policy', 'policy'),
+    ('guest_name', 'guest_name'),
+    ('guest_count', 'guest_count'),
+    ('adults', 'adults'),
+    ('children', 'children'),
+    ('max_children', 'max_children'),
+    ('extra_bed', 'extra_bed'),
+    ('with_breakfast', 'with_breakfast'),
+    ('currency', 'currency'),
+    ('tax', 'tax'),
+    ('fees', 'fees'),
+    ('notes_extra', 'notes_extra'),
+    ('notes_facilities', 'notes_facilities'),
+    ('notes_info', 'notes_info'),
+    ('notes_meal', 'notes_meal'),
+)
+_ROOM_UPDATE_MAPPING_ACCEPTED = _ROOM_UPDATE_MAPPING + (
+    ('checkin_original', 'checkin'),
+    ('checkout_original', 'checkout'),
+    ('price_accepted', 'price_accepted'),
+    ('netto_price_accepted', 'netto_price_accepted'),
+)
+_ROOM_UPDATE_MAPPING_CHANGED = _ROOM_UPDATE_MAPPING + (('price', 'price'), ('netto_price', 'netto_price'))
+
+_DAY_UPDATE_MAPPING = (('tax', 'tax'), ('currency', 'currency'), ('roomtype_id', 'roomtype_id'), ('room_id', 'room_id'))
+_DAY_UPDATE_MAPPING_ACCEPTED = _DAY_UPDATE_MAPPING + (('price_accepted', 'price_accepted'),)
+_DAY_UPDATE_MAPPING_CHANGED = _DAY_UPDATE_MAPPING + (('price_changed', 'price_changed'),)
+
+# Heavy columns which are not loaded by select(detailed=False)
+_RESERVATION_DEFERRED_FIELDS = ('guest_address', 'guest_comments', 'creditcard_info', 'payment_info')
+_ROOM_DEFERRED_FIELDS = ('policy', 'policy_original', 'notes_extra', 'notes_facilities', 'notes_meal')
+
+
 class ReservationsRepoOrm(ReservationsRepo):
+    @transaction.atomic
     def accept(self, pk: int, price_ids: List[int] = None) -> Maybe[Reservation]:
         price_ids = [cf.get_int_or_none(x) for x in price_ids or []]
         price_ids = [x for x in price_ids if x is not None and x > 0]
         try:
-            model = ReservationModel.objects.filter(id=pk)[0]
+            model = ReservationModel.objects.select_for_update().get(id=pk)
             if model.is_verified:
                 return self.get(pk)
             model.checkin_original = model.checkin
@@ -42,7 +126,8 @@ class ReservationsRepoOrm(ReservationsRepo):
                 ]
             )
 
-            for room in model.rooms.active():
+            changed_rooms = []
+            for room in model.rooms.active().select_for_update():
                 is_changed = False
                 if room.channel_rate_id != room.channel_rate_id_changed:
                     room.channel_rate_id = room.channel_rate_id_changed
@@ -67,39 +152,43 @@ class ReservationsRepoOrm(ReservationsRepo):
                     room.netto_price_accepted = room.netto_price
                     is_changed = True
                 if is_changed:
-                    room.save(
-                        update_fields=[
-                            'channel_rate_id',
-                            'checkin_original',
-                            'checkout_original',
-                            'rate_plan_id_original',
-                            'policy_original',
-                            'price_accepted',
-                            'netto_price_accepted',
-                        ]
+                    room.updated_at = timezone.now()
+                    changed_rooms.append(room)
+
+            if changed_rooms:
+                ReservationRoomModel.objects.bulk_update(
+                    changed_rooms,
+                    fields=[
+                        'channel_rate_id',
+                        'checkin_original',
+                        'checkout_original',
+                        'rate_plan_id_original',
+                        'policy_original',
+                        'price_accepted',
+                        'netto_price_accepted',
+                        'updated_at',
+                    ],
+                )
+
+            # Update daily prices of all active rooms at once
+            if price_ids:
+                (
+                    ReservationDayModel.objects
+                    .filter(reservation_room__reservation_id=pk, reservation_room__is_deleted=False, id__in=price_ids)
+                    .exclude(price_original=F('price_changed'), price_accepted=F('price_changed'))
+                    .update(
+                        price_original=F('price_changed'), price_accepted=F('price_changed'), updated_at=timezone.now()
                     )
-
-                # Update daily prices
-                for price in room.day_prices.filter(id__in=price_ids):
-                    is_changed = False
-                    if price.price_original != price.price_changed:
-                        price.price_original = price.price_changed
-                        is_changed = True
-                    if price.price_accepted != price.price_changed:
-                        price.price_accepted = price.price_changed
-                        is_changed = True
-                    if is_changed:
-                        price.save(update_fields=['price_original', 'price_accepted'])
-
+                )
             return self.get(pk)
-        except IndexError:
+        except ReservationModel.DoesNotExist:
             return Nothing
 
     def get(self, pk: int, with_deleted_rooms: bool = False) -> Maybe[Reservation]:
-        queryset = ReservationModel.objects.prefetch_related('rooms', 'rooms__day_prices').filter(pk=pk)
         try:
-            return Some(self.model_to_reservation(queryset[0], with_deleted_rooms=with_deleted_rooms))
-        except IndexError:
+            model = ReservationModel.objects.prefetch_related(self.get_rooms_prefetch(with_deleted_rooms)).get(pk=pk)
+            return Some(self.model_to_reservation(model))
+        except ReservationModel.DoesNotExist:
             return Nothing
 
     def is_room_busy(
@@ -107,8 +196,7 @@ class ReservationsRepoOrm(ReservationsRepo):
     ) -> bool:
         queryset = (
             ReservationDayModel.objects
-            .filter(room_id=room_id, day__gte=start_date, day__lte=end_date)
-            .exclude(reservation_room__is_deleted=True)
+            .filter(room_id=room_id, day__gte=start_date, day__lte=end_date, reservation_room__is_deleted=False)
             .exclude(reservation_room__reservation__status=ReservationStatuses.CANCEL.name)
         )
         if exclude_rooms is not None and exclude_rooms:
@@ -130,8 +218,11 @@ class ReservationsRepoOrm(ReservationsRepo):
         start_date: datetime.date = None,
         end_date: datetime.date = None,
         pks: List[int] = None,
+        detailed: bool = True,
     ) -> List[Reservation]:
-        queryset = ReservationModel.objects.prefetch_related('rooms', 'rooms__day_prices')
+        queryset = ReservationModel.objects.prefetch_related(self.get_rooms_prefetch(detailed=detailed))
+        if not detailed:
+            queryset = queryset.defer(*_RESERVATION_DEFERRED_FIELDS)
         if connection is not None:
             queryset = queryset.filter(connection_id=connection.id)
         elif house_id is not None:
@@ -146,7 +237,7 @@ class ReservationsRepoOrm(ReservationsRepo):
             queryset = queryset.filter(checkin__lte=end_date)
         if pks is not None and pks:
             queryset = queryset.filter(id__in=pks)
-        return [self.model_to_reservation(x) for x in queryset]
+        return [self.model_to_reservation(x, detailed=detailed) for x in queryset]
 
     def select_busy_days(
         self, house_id: int, roomtype_ids: List[int], start_date: datetime.date = None, end_date: datetime.date = None
@@ -155,38 +246,39 @@ class ReservationsRepoOrm(ReservationsRepo):
             return {}
         queryset = (
             ReservationDayModel.objects
-            .filter(roomtype_id__in=roomtype_ids, reservation_room__reservation__house_id=house_id)
-            .exclude(reservation_room__is_deleted=True)
+            .filter(
+                roomtype_id__in=roomtype_ids,
+                reservation_room__reservation__house_id=house_id,
+                reservation_room__is_deleted=False,
+            )
             .exclude(reservation_room__reservation__status=ReservationStatuses.CANCEL.name)
         )
         if start_date is not None:
             queryset = queryset.filter(day__gte=start_date)
         if end_date is not None:
             queryset = queryset.filter(day__lte=end_date)
-        queryset = queryset.values('roomtype_id', 'day').annotate(Count('id'))
-
-        result = {}
-        for item in queryset:
-            if item['roomtype_id'] not in result:
-                result[item['roomtype_id']] = {}
-            result[item['roomtype_id']][item['day']] = item['id__count']
-        return result
-
-    def model_to_reservation(self, model: ReservationModel, with_deleted_rooms: bool = False) -> Reservation:
-        if model.guest_contact_ids is not None and model.guest_contact_ids != '':
-            contact_ids = [cf.get_int_or_none(x) for x in model.guest_contact_ids.split(',')]
-            contact_ids = [x for x in contact_ids if x is not None and x > 0]
-        else:
-            contact_ids = []
+        queryset = queryset.values_list('roomtype_id', 'day').annotate(Count('id')).order_by()
+
+        result = collections.defaultdict(dict)
+        for roomtype_id, day, count in queryset:
+            result[roomtype_id][day] = count
+        return dict(result)
+
+    def model_to_reservation(
+        self, model: ReservationModel, detailed: bool = True, rooms: List[ReservationRoom] = None
+    ) -> Reservation:
+        contact_ids = [
+            x for x in map(cf.get_int_or_none, (model.guest_contact_ids or '').split(',')) if x is not None and x > 0
+        ]
         reservation = Reservation(
             id=model.pk,
             house_id=model.house_id,  # noqa
-            connection_id=model.connection.id if model.connection is not None else None,
-            source=ReservationSources.get_by_name(model.source),
-            channel=Channels.get_by_name(model.channel),
+            connection_id=model.connection_id,  # noqa
+            source=_SOURCES_BY_NAME.get(model.source),
+            channel=_CHANNELS_BY_NAME.get(model.channel),
             channel_id=model.channel_id,
-            status=ReservationStatuses.get_by_name(model.status),
-            close_reason=RoomCloseReasons.get_by_name(model.close_reason),
+            status=_STATUSES_BY_NAME.get(model.status),
+            close_reason=_CLOSE_REASONS_BY_NAME.get(model.close_reason),
             checkin=model.checkin,
             checkout=model.checkout,
             room_count=model.room_count,
@@ -204,29 +296,35 @@ class ReservationsRepoOrm(ReservationsRepo):
             guest_country=model.guest_country,
             guest_nationality=model.guest_nationality,
             guest_city=model.guest_city,
-            guest_address=model.guest_address,
             guest_post_code=model.guest_post_code,
-            guest_comments=model.guest_comments,
             guest_contact_id=model.guest_contact_id,
             guest_contact_ids=contact_ids,
             promo=model.promo,
-            creditcard_info=model.creditcard_info,
-            payment_info=model.payment_info,
             booked_at=model.booked_at,
             is_verified=model.is_verified,
             opportunity_id=model.opportunity_id,
             quotation_id=model.quotation_id,
         )
-
-        queryset = model.rooms.all() if with_deleted_rooms else model.rooms.active()  # noqa
-        for room in queryset:
-            reservation.rooms.append(self.model_to_reservation_room(room))
+        if detailed:
+            reservation.guest_address = model.guest_address
+            reservation.guest_comments = model.guest_comments
+            reservation.creditcard_info = model.creditcard_info
+            reservation.payment_info = model.payment_info
+
+        if rooms is not None:
+            reservation.rooms = rooms
+            return reservation
+
+        for room in model.selected_rooms:  # noqa
+            reservation.rooms.append(self.model_to_reservation_room(room, detailed=detailed))
         return reservation
 
-    def model_to_reservation_room(self, model: ReservationRoomModel) -> ReservationRoom:
+    def model_to_reservation_room(
+        self, model: ReservationRoomModel, detailed: bool = True, days: List[ReservationDayModel] = None
+    ) -> ReservationRoom:
         room = ReservationRoom(
             id=model.pk,
-            reservation_id=model.reservation.id,
+            reservation_id=model.reservation_id,  # noqa
             channel_id=model.channel_id,
             channel_rate_id=model.channel_rate_id,
             rate_plan_id=model.rate_plan_id,
@@ -249,29 +347,38 @@ class ReservationsRepoOrm(ReservationsRepo):
             fees=model.fees,
             netto_price=model.netto_price,
             netto_price_accepted=model.netto_price_accepted,
-            notes_extra=model.notes_extra,
-            notes_facilities=model.notes_facilities,
             notes_info=model.notes_info,
-            notes_meal=model.notes_meal,
-            policy=model.policy or {},
 
             # Read-Only
             checkin_original=model.checkin_original,
             checkout_original=model.checkout_original,
             rate_plan_id_original=model.rate_plan_id_original,
-            policy_original=model.policy_original,
             is_deleted=model.is_deleted,
             deleted_at=model.deleted_at,
         )
-        for price in model.day_prices.all():  # noqa
+        if detailed:
+            room.notes_extra = model.notes_extra
+            room.notes_facilities = model.notes_facilities
+            room.notes_meal = model.notes_meal
+            room.policy = model.policy or {}
+            room.policy_original = model.policy_original
+        for price in model.day_prices.all() if days is None else days:  # noqa
             room.day_prices.append(self.model_to_reservation_day(price))
         return room
 
+    @staticmethod
+    def get_rooms_prefetch(with_deleted_rooms: bool = False, detailed: bool = True) -> Prefetch:
+        """Prefetch rooms with their days into the selected_rooms list used by model_to_reservation()"""
+        queryset = ReservationRoomModel.objects.all() if with_deleted_rooms else ReservationRoomModel.objects.active()
+        if not detailed:
+            queryset = queryset.defer(*_ROOM_DEFERRED_FIELDS)
+        return Prefetch('rooms', queryset=queryset.prefetch_related('day_prices'), to_attr='selected_rooms')
+
     @staticmethod
     def model_to_reservation_day(model: ReservationDayModel) -> ReservationDay:
         return ReservationDay(
             id=model.pk,
-            reservation_room_id=model.reservation_room.id,
+            reservation_room_id=model.reservation_room_id,  # noqa
             day=model.day,
             price_changed=model.price_changed,
             price_accepted=model.price_accepted,
@@ -284,6 +391,7 @@ class ReservationsRepoOrm(ReservationsRepo):
             price_original=model.price_original,
         )
 
+    @transaction.atomic
     def _create_reservation(self, reservation: Reservation) -> Tuple[Maybe[Reservation], bool]:
         model = ReservationModel.objects.create(
             house_id=reservation.house_id,
@@ -316,7 +424,7 @@ class ReservationsRepoOrm(ReservationsRepo):
             guest_post_code=reservation.guest_post_code,
             guest_comments=reservation.guest_comments,
             guest_contact_id=reservation.guest_contact_id,
-            guest_contact_ids=','.join([str(x) for x in reservation.guest_contact_ids]),
+            guest_contact_ids=','.join(map(str, reservation.guest_contact_ids)),
             promo=reservation.promo,
             creditcard_info=reservation.creditcard_info,
             payment_info=reservation.payment_info,
@@ -325,14 +433,30 @@ class ReservationsRepoOrm(ReservationsRepo):
             quotation_id=reservation.quotation_id,
             is_verified=False,
         )
-        if reservation.rooms:
-            for room in reservation.rooms:
-                self._create_reservation_room(model, room)
-
-        return self.get(model.id), True  # return fresh data from DB
+        rooms = self._create_reservation_rooms(model, reservation.rooms) if reservation.rooms else []
+
+        # All values are known after insert, no need to read them back from DB
+        return Some(self.model_to_reservation(model, rooms=rooms)), True
+
+    def _create_reservation_rooms(self, model: ReservationModel, rooms: List[ReservationRoom]) -> List[ReservationRoom]:
+        """Insert rooms and all their days with two queries, return saved rooms"""
+        room_models = ReservationRoomModel.objects.bulk_create([self._make_reservation_room(model, x) for x in rooms])
+        day_models = [
+            self._make_reservation_day(room_model, price)
+            for room_model, room in zip(room_models, rooms)
+            for price in sorted(room.day_prices, key=lambda x: x.day)
+        ]
+        if day_models:
+            ReservationDayModel.objects.bulk_create(day_models)
+
+        days = collections.defaultdict(list)
+        for day_model in day_models:
+            days[day_model.reservation_room_id].append(day_model)  # noqa
+        return [self.model_to_reservation_room(x, days=days[x.pk]) for x in room_models]
 
-    def _create_reservation_room(self, model: ReservationModel, room: ReservationRoom) -> None:
-        room_model = ReservationRoomModel.objects.create(
+    @staticmethod
+    def _make_reservation_room(model: ReservationModel, room: ReservationRoom) -> ReservationRoomModel:
+        return ReservationRoomModel(
             reservation_id=model.pk,
             channel_id=room.channel_id,
             channel_rate_id=room.channel_rate_id,
@@ -367,13 +491,10 @@ class ReservationsRepoOrm(ReservationsRepo):
             policy=room.policy,
             policy_original=room.policy,
         )
-        if room.day_prices:
-            for price in room.day_prices:
-                self._create_reservation_day(room_model, price)
 
     @staticmethod
-    def _create_reservation_day(model: ReservationRoomModel, data: ReservationDay):
-        ReservationDayModel.objects.create(
+    def _make_reservation_day(model: ReservationRoomModel, data: ReservationDay) -> ReservationDayModel:
+        return ReservationDayModel(
             reservation_room_id=model.pk,
             day=data.day,
             price_original=data.price_changed,
@@ -385,9 +506,10 @@ class ReservationsRepoOrm(ReservationsRepo):
             room_id=data.room_id,
         )
 
+    @transaction.atomic
     def _cancel_reservation(self, reservation: Reservation) -> Tuple[Maybe[Reservation], bool]:
         try:
-            model = ReservationModel.objects.filter(id=reservation.id)[0]
+            model = ReservationModel.objects.select_for_update().get(id=reservation.id)
 
             mapping = {'status': 'status', 'is_verified': 'is_verified'}
             is_changed = False
@@ -400,53 +522,22 @@ class ReservationsRepoOrm(ReservationsRepo):
                 model.save(update_fields=list(mapping.keys()))
 
             return self.get(model.id), is_changed  # return fresh data from DB
-        except IndexError:
+        except ReservationModel.DoesNotExist:
             return Nothing, False
 
+    @transaction.atomic
     def _update_reservation(
         self, reservation: Reservation, with_accepted_prices: bool = False
     ) -> Tuple[Maybe[Reservation], bool]:
         try:
-            model = ReservationModel.objects.filter(id=reservation.id)[0]
-
-            mapping = {
-                'status': 'status',
-                'checkin': 'checkin',
-                'checkout': 'checkout',
-                'room_count': 'room_count',
-                'currency': 'currency',
-                'tax': 'tax',
-                'fees': 'fees',
-                'guest_name': 'guest_name',
-                'guest_surname': 'guest_surname',
-                'guest_email': 'guest_email',
-                'guest_phone': 'guest_phone',
-                'guest_country': 'guest_country',
-                'guest_nationality': 'guest_nationality',
-                'guest_city': 'guest_city',
-                'guest_address': 'guest_address',
-                'guest_post_code': 'guest_post_code',
-                'guest_comments': 'guest_comments',
-                'promo': 'promo',
-                'creditcard_info': 'creditcard_info',
-                'payment_info': 'payment_info',
-                'close_reason': 'close_reason',
-                'guest_contact_id': 'guest_contact_id',
-                'guest_contact_ids': 'guest_contact_ids',
-                'opportunity_id': 'opportunity_id',
-                'quotation_id': 'quotation_id',
-            }
-            if with_accepted_prices:
-                mapping['checkin_original'] = 'checkin'
-                mapping['checkout_original'] = 'checkout'
-                mapping['price_accepted'] = 'price_accepted'
-                mapping['netto_price_accepted'] = 'netto_price_accepted'
-            else:
-                mapping['price'] = 'price'
-                mapping['netto_price'] = 'netto_price'
+            model = ReservationModel.objects.select_for_update().get(id=reservation.id)
 
-            is_changed = False
-            for field, source in mapping.items():
+            mapping = (
+                _RESERVATION_UPDATE_MAPPING_ACCEPTED if with_accepted_prices else _RESERVATION_UPDATE_MAPPING_CHANGED
+            )
+
+            changed_fields = []
+            for field, source in mapping:
                 if source == 'status':
                     value = (
                         reservation.status.name if reservation.status is not None else getattr(reservation, source)
@@ -458,146 +549,90 @@ class ReservationsRepoOrm(ReservationsRepo):
                         else getattr(reservation, source)
                     )
                 elif source == 'guest_contact_ids':
-                    value = ','.join([str(x) for x in reservation.guest_contact_ids])
+                    value = ','.join(map(str, reservation.guest_contact_ids))
                 else:
                     value = getattr(reservation, source)
                 if getattr(model, field) != value:
                     setattr(model, field, value)
-                    is_changed = True
-            if is_changed:
-                model.save(update_fields=list(mapping.keys()))
-
-            existed_external_ids = [x.external_id for x in model.rooms.only('external_id')]
-            processed_external_ids = []
+                    changed_fields.append(field)
+            if changed_fields:
+                model.save(update_fields=changed_fields)
+            is_changed = bool(changed_fields)
+
+            # Load all active rooms with their days at once, instead of query per room and per day
+            existed_rooms = {x.external_id: x for x in model.rooms.active().prefetch_related('day_prices')}
+            processed_external_ids = set()
+            new_rooms = []
             for room in reservation.rooms:
-                if room.external_id in existed_external_ids:
+                if room.external_id in existed_rooms:
                     is_changed |= self._update_reservation_room(
-                        model, room, with_accepted_prices=with_accepted_prices
+                        existed_rooms[room.external_id], room, with_accepted_prices=with_accepted_prices
                     )
                 else:
-                    self._create_reservation_room(model, room)
+                    new_rooms.append(room)
                     is_changed = True
-                processed_external_ids.append(room.external_id)
+                processed_external_ids.add(room.external_id)
+            if new_rooms:
+                self._create_reservation_rooms(model, new_rooms)
 
-            deleted_external_ids = [x for x in existed_external_ids if x not in processed_external_ids]
-            for external_id in deleted_external_ids:
-                self._delete_reservation_room(model, external_id)
+            deleted_ids = [x.id for k, x in existed_rooms.items() if k not in processed_external_ids]
+            if deleted_ids:
+                ReservationRoomModel.objects.filter(id__in=deleted_ids).soft_delete()
                 is_changed = True
 
             return self.get(model.id), is_changed  # return fresh data from DB
 
-        except IndexError:
+        except ReservationModel.DoesNotExist:
             return Nothing, False
 
     def _update_reservation_room(
-        self, model: ReservationModel, data: 'ReservationRoom', with_accepted_prices: bool = False
+        self, room_model: ReservationRoomModel, data: 'ReservationRoom', with_accepted_prices: bool = False
     ) -> bool:
-        try:
-            room_model = ReservationRoomModel.objects.active().filter(
-                reservation_id=model.pk, external_id=data.external_id
-            )[0]
-
-            mapping = {
-                'channel_rate_id_changed': 'channel_rate_id',
-                'external_name': 'external_name',
-                'checkin': 'checkin',
-                'checkout': 'checkout',
-                'rate_plan_id': 'rate_plan_id',
-                'policy': 'policy',
-                'guest_name': 'guest_name',
-                'guest_count': 'guest_count',
-                'adults': 'adults',
-                'children': 'children',
-                'max_children': 'max_children',
-                'extra_bed': 'extra_bed',
-                'with_breakfast': 'with_breakfast',
-                'currency': 'currency',
-                'tax': 'tax',
-                'fees': 'fees',
-                'notes_extra': 'notes_extra',
-                'notes_facilities': 'notes_facilities',
-                'notes_info': 'notes_info',
-                'notes_meal': 'notes_meal',
-            }
-            if with_accepted_prices:
-                mapping['checkin_original'] = 'checkin'
-                mapping['checkout_original'] = 'checkout'
-                mapping['price_accepted'] = 'price_accepted'
-                mapping['netto_price_accepted'] = 'netto_price_accepted'
+        mapping = _ROOM_UPDATE_MAPPING_ACCEPTED if with_accepted_prices else _ROOM_UPDATE_MAPPING_CHANGED
+        changed_fields = []
+        for field, source in mapping:
+            value = getattr(data, source)
+            if getattr(room_model, field) != value:
+                setattr(room_model, field, value)
+                changed_fields.append(field)
+        if changed_fields:
+            room_model.save(update_fields=changed_fields)
+        is_changed = bool(changed_fields)
+
+        existed_days = {x.day: x for x in room_model.day_prices.all()}  # noqa
+        processed_days = set()
+        new_days = []
+        for price_data in data.day_prices:
+            if price_data.day in existed_days:
+                is_changed |= self._update_reservation_day(
+                    existed_days[price_data.day], price_data, with_accepted_prices=with_accepted_prices
+                )
             else:
-                mapping['price'] = 'price'
-                mapping['netto_price'] = 'netto_price'
-            is_changed = False
-            for field, source in mapping.items():
-                value = getattr(data, source)
-                if getattr(room_model, field) != value:
-                    setattr(room_model, field, value)
-                    is_changed = True
-            if is_changed:
-                room_model.save(update_fields=list(mapping.keys()))
-
-            existed_days = [x.day for x in room_model.day_prices.only('day')]
-            processed_days = []
-            for price_data in data.day_prices:
-                if price_data.day in existed_days:
-                    is_changed |= self._update_reservation_day(
-                        room_model, price_data, with_accepted_prices=with_accepted_prices
-                    )
-                else:
-                    self._create_reservation_day(room_model, price_data)
-                    is_changed = True
-                processed_days.append(price_data.day)
-
-            deleted_days = [x for x in existed_days if x not in processed_days]
-            for day in deleted_days:
-                self._delete_reservation_day(room_model, day)
+                new_days.append(self._make_reservation_day(room_model, price_data))
                 is_changed = True
+            processed_days.add(price_data.day)
+        if new_days:
+            ReservationDayModel.objects.bulk_create(new_days)
 
-            return is_changed
+        for day, day_model in existed_days.items():
+            if day not in processed_days:
+                day_model.delete()
+                is_changed = True
 
-        except IndexError:
-            return False
+        return is_changed
 
     @staticmethod
     def _update_reservation_day(
-        model: ReservationDayModel, data: ReservationDay, with_accepted_prices: bool = False
+        day_model: ReservationDayModel, data: ReservationDay, with_accepted_prices: bool = False
     ) -> bool:
-        try:
-            day_model = ReservationDayModel.objects.filter(reservation_room_id=model.pk, day=data.day)[0]
-
-            mapping = {'tax': 'tax', 'currency': 'currency', 'roomtype_id': 'roomtype_id', 'room_id': 'room_id'}
-            if with_accepted_prices:
-                mapping['price_accepted'] = 'price_accepted'
-            else:
-                mapping['price_changed'] = 'price_changed'
-            is_changed = False
-            for field, source in mapping.items():
-                value = getattr(data, source)
-                if getattr(day_model, field) != value:
-                    setattr(day_model, field, value)
-                    is_changed = True
-
-            if is_changed:
-                day_model.save(update_fields=list(mapping.keys()))
-            return is_changed
-
-        except IndexError:
-            return False
-
-    @staticmethod
-    def _delete_reservation_room(model: ReservationModel, external_id: str) -> None:
-        try:
-            room_model = ReservationRoomModel.objects.active().filter(
-                reservation_id=model.pk, external_id=external_id
-            )[0]
-            room_model.delete()
-        except IndexError:
-            pass
-
-    @staticmethod
-    def _delete_reservation_day(model: ReservationRoomModel, day: datetime.date) -> None:
-        try:
-            day_model = ReservationDayModel.objects.filter(reservation_room_id=model.pk, day=day)[0]
-            day_model.delete()
-        except IndexError:
-            pass
+        mapping = _DAY_UPDATE_MAPPING_ACCEPTED if with_accepted_prices else _DAY_UPDATE_MAPPING_CHANGED
+        changed_fields = []
+        for field, source in mapping:
+            value = getattr(data, source)
+            if getattr(day_model, field) != value:
+                setattr(day_model, field, value)
+                changed_fields.append(field)
+
+        if changed_fields:
+            day_model.save(update_fields=changed_fields)
+        return bool(changed_fields)
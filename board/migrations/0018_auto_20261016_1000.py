@@ -0,0 +1,17 @@
+# Generated by Django 3.1.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0017_auto_20201104_1405'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservationday',
+            index=models.Index(fields=['room', 'day'], name='board_reser_room_id_929fcb_idx'),
+        ),
+    ]
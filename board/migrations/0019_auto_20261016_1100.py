@@ -0,0 +1,50 @@
+# Generated by Django 3.1.2 on 2026-10-16 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0018_auto_20261016_1000'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reservationroom',
+            name='is_deleted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['house', 'checkin', 'checkout'], name='board_reser_house_i_a095fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationday',
+            index=models.Index(fields=['reservation_room', 'day'], name='board_reser_reserva_263e52_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationday',
+            index=models.Index(fields=['roomtype_id', 'day'], name='board_reser_roomtyp_b4bcfb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservationroom',
+            index=models.Index(fields=['reservation', 'is_deleted'], name='board_reser_reserva_374156_idx'),
+        ),
+        migrations.AlterField(
+            model_name='reservationday',
+            name='reservation_room',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='day_prices', to='board.reservationroom'),
+        ),
+        migrations.AlterField(
+            model_name='reservationday',
+            name='room',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='houses.room'),
+        ),
+        migrations.AlterField(
+            model_name='reservationroom',
+            name='reservation',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='rooms', to='board.reservation'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.1.2 on 2026-10-16 12:00
+
+import common.db
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0019_auto_20261016_1100'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reservation',
+            name='creditcard_info',
+            field=common.db.OrjsonJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='reservationroom',
+            name='policy',
+            field=common.db.OrjsonJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='reservationroom',
+            name='policy_original',
+            field=common.db.OrjsonJSONField(blank=True, default=dict),
+        ),
+    ]
@@ -1,11 +1,28 @@
 from decimal import Decimal
 
 from django.db import models
-from django.db.models.fields.json import JSONField
 
-from common.db import TimeableModel
+from common.db import OrjsonJSONField, TimeableModel
 from effective_tours.constants import Channels, ReservationSources, ReservationStatuses, RoomCloseReasons
 
+_ZERO = Decimal(0)
+_DECIMAL_FIELDS = ('price', 'price_accepted', 'tax', 'fees', 'netto_price', 'netto_price_accepted')
+_STRING_FIELDS = (
+    'guest_name',
+    'guest_surname',
+    'guest_email',
+    'guest_phone',
+    'guest_country',
+    'guest_nationality',
+    'guest_city',
+    'guest_address',
+    'guest_post_code',
+    'guest_comments',
+    'guest_contact_ids',
+    'promo',
+    'payment_info',
+)
+
 
 class Reservation(TimeableModel):
     house = models.ForeignKey('houses.House', on_delete=models.PROTECT, related_name='+', blank=True, null=True)
@@ -51,7 +68,7 @@ class Reservation(TimeableModel):
     guest_post_code = models.CharField(max_length=10, blank=True, default='')
     guest_comments = models.TextField(blank=True, default='')
     promo = models.CharField(max_length=250, blank=True, default='')
-    creditcard_info = JSONField(blank=True, default=dict)
+    creditcard_info = OrjsonJSONField(blank=True, default=dict)
     payment_info = models.CharField(max_length=250, blank=True, default='')
     booked_at = models.DateTimeField()
 
@@ -66,33 +83,22 @@ class Reservation(TimeableModel):
 
     class Meta:
         app_label = 'board'
-        indexes = [models.Index(fields=['channel_id'])]
+        indexes = [models.Index(fields=['channel_id']), models.Index(fields=['house', 'checkin', 'checkout'])]
 
     def __str__(self) -> str:
         return f"{self.source} CHANNEL ID={self.channel_id}"
 
     def save(self, **kwargs) -> None:
-        for name in (
-            'guest_name',
-            'guest_surname',
-            'guest_email',
-            'guest_phone',
-            'guest_country',
-            'guest_nationality',
-            'guest_city',
-            'guest_address',
-            'guest_post_code',
-            'guest_comments',
-            'guest_contact_ids',
-            'promo',
-            'payment_info',
-        ):
-            if getattr(self, name) is None:
-                setattr(self, name, '')
-        for name in ('price', 'price_accepted', 'tax', 'fees', 'netto_price', 'netto_price_accepted'):
-            if getattr(self, name) is None:
-                setattr(self, name, Decimal(0))
-
+        self.set_defaults()
         if 'update_fields' in kwargs and kwargs['update_fields'] and 'updated_at' not in kwargs['update_fields']:
             kwargs['update_fields'].append('updated_at')
         super().save(**kwargs)
+
+    def set_defaults(self) -> None:
+        """Replace empty values with defaults"""
+        for name in _STRING_FIELDS:
+            if getattr(self, name) is None:
+                setattr(self, name, '')
+        for name in _DECIMAL_FIELDS:
+            if getattr(self, name) is None:
+                setattr(self, name, _ZERO)
@@ -4,12 +4,24 @@ from django.db import models
 
 from common.db import TimeableModel
 
+_ZERO = Decimal(0)
+_DECIMAL_FIELDS = ("price_original", "price_changed", "price_accepted", "tax")
+
+
+class ReservationDayQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        for obj in objs:
+            obj.set_defaults()  # bulk_create() doesn't call save()
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 class ReservationDay(TimeableModel):
-    reservation_room = models.ForeignKey("board.ReservationRoom", on_delete=models.CASCADE, related_name="day_prices")
+    reservation_room = models.ForeignKey(
+        "board.ReservationRoom", on_delete=models.CASCADE, related_name="day_prices", db_index=False
+    )
     day = models.DateField()
     roomtype_id = models.PositiveIntegerField(blank=True, null=True)
-    room = models.ForeignKey("houses.Room", on_delete=models.SET_NULL, blank=True, null=True)
+    room = models.ForeignKey("houses.Room", on_delete=models.SET_NULL, blank=True, null=True, db_index=False)
 
     price_original = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     price_changed = models.DecimalField(max_digits=10, decimal_places=2, default=0)
@@ -19,17 +31,28 @@ class ReservationDay(TimeableModel):
 
     currency = models.CharField(max_length=3, blank=True, null=True)
 
+    objects = ReservationDayQuerySet.as_manager()
+
     class Meta:
         app_label = "board"
         ordering = ["day"]
+        indexes = [
+            models.Index(fields=["room", "day"]),
+            models.Index(fields=["reservation_room", "day"]),
+            models.Index(fields=["roomtype_id", "day"]),
+        ]
 
     def __str__(self) -> str:
         return f"DAY={self.day.strftime('%Y-%m-%d')}"
 
     def save(self, **kwargs) -> None:
-        for name in ("price_original", "price_changed", "price_accepted", "tax"):
-            if getattr(self, name) is None:
-                setattr(self, name, Decimal(0))
-        if "update_fields" in kwargs and kwargs["update_fields"]:
+        self.set_defaults()
+        if "update_fields" in kwargs and kwargs["update_fields"] and "updated_at" not in kwargs["update_fields"]:
             kwargs["update_fields"].append("updated_at")
         super().save(**kwargs)
+
+    def set_defaults(self) -> None:
+        """Replace empty values with defaults"""
+        for name in _DECIMAL_FIELDS:
+            if getattr(self, name) is None:
+                setattr(self, name, _ZERO)
@@ -1,19 +1,32 @@
 from decimal import Decimal
 
 from django.db import models
-from django.db.models.fields.json import JSONField
 from django.utils import timezone
 
-from common.db import TimeableModel
+from common.db import OrjsonJSONField, TimeableModel
+
+_ZERO = Decimal(0)
+_INTEGER_FIELDS = ('adults', 'children', 'max_children', 'extra_bed')
+_DECIMAL_FIELDS = ('price', 'price_accepted', 'tax', 'fees', 'netto_price', 'netto_price_accepted')
+_STRING_FIELDS = ('external_name', 'guest_name', 'notes_extra', 'notes_facilities', 'notes_info', 'notes_meal')
 
 
 class ReservationRoomQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_deleted=False)
 
+    def soft_delete(self) -> int:
+        now = timezone.now()
+        return self.update(is_deleted=True, deleted_at=now, updated_at=now)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        for obj in objs:
+            obj.set_defaults()  # bulk_create() doesn't call save()
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 class ReservationRoom(TimeableModel):
-    reservation = models.ForeignKey('board.Reservation', on_delete=models.CASCADE, related_name='rooms')
+    reservation = models.ForeignKey('board.Reservation', on_delete=models.CASCADE, related_name='rooms', db_index=False)
     channel_id = models.CharField(max_length=20)
     rate_id = models.PositiveIntegerField(blank=True, null=True)
 
@@ -56,36 +69,40 @@ class ReservationRoom(TimeableModel):
     notes_info = models.TextField(blank=True, default='')
     notes_meal = models.TextField(blank=True, default='')
 
-    policy = JSONField(blank=True, default=dict)
-    policy_original = JSONField(blank=True, default=dict)
+    policy = OrjsonJSONField(blank=True, default=dict)
+    policy_original = OrjsonJSONField(blank=True, default=dict)
 
-    is_deleted = models.BooleanField(default=False, db_index=True)
+    is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(blank=True, null=True)
 
     objects = ReservationRoomQuerySet.as_manager()
 
     class Meta:
         app_label = 'board'
+        indexes = [models.Index(fields=['reservation', 'is_deleted'])]
 
     def __str__(self) -> str:
         return f"CHANNEL ID={self.channel_id} RATE={self.channel_rate_id}"
 
     def save(self, **kwargs) -> None:
+        self.set_defaults()
+        if 'update_fields' in kwargs and kwargs['update_fields'] and 'updated_at' not in kwargs['update_fields']:
+            kwargs['update_fields'].append('updated_at')
+        super().save(**kwargs)
+
+    def set_defaults(self) -> None:
+        """Replace empty values with defaults"""
         self.guest_count = self.guest_count or 1
-        for name in ('adults', 'children', 'max_children', 'extra_bed'):
+        for name in _INTEGER_FIELDS:
             if getattr(self, name) is None:
                 setattr(self, name, 0)
-        for name in ('price', 'price_accepted', 'tax', 'fees', 'netto_price', 'netto_price_accepted'):
+        for name in _DECIMAL_FIELDS:
             if getattr(self, name) is None:
-                setattr(self, name, Decimal(0))
-        for name in ('external_name', 'guest_name', 'notes_extra', 'notes_facilities', 'notes_info', 'notes_meal'):
+                setattr(self, name, _ZERO)
+        for name in _STRING_FIELDS:
             if getattr(self, name) is None:
                 setattr(self, name, '')
 
-        if 'update_fields' in kwargs and kwargs['update_fields']:
-            kwargs['update_fields'].append('updated_at')
-        super().save(**kwargs)
-
     def delete(self, **kwargs) -> None:
         self.is_deleted = True
         self.deleted_at = timezone.now()
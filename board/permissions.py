@@ -21,7 +21,6 @@ DefaultGroupPermissions = {
         Permissions.RESERVATION_READ,
         Permissions.RESERVATION_CREATE,
         Permissions.RESERVATION_DELETE,
-        Permissions.RESERVATION_DELETE,
     ],
     Groups.MANAGER: [Permissions.BOARD_READ, Permissions.RESERVATION_READ],
     Groups.STAFF: [Permissions.BOARD_READ],
@@ -1,6 +1,6 @@
 import abc
 import datetime
-from typing import Dict, List, TYPE_CHECKING, Tuple, Union
+from typing import Dict, List, Optional, TYPE_CHECKING, Tuple, Union
 
 from returns.maybe import Maybe
 
@@ -21,6 +21,32 @@ class OccupancyRepo(abc.ABC):
     ) -> Dict[datetime.date, int]:
         pass
 
+    @abc.abstractmethod
+    def start_inventory_update(self, house_id: int, timeout: int) -> bool:
+        """Open the window of inventory push for House, return False if it is already opened"""
+        pass
+
+    @abc.abstractmethod
+    def queue_inventory_update(
+        self,
+        house_id: int,
+        start_date: Union[datetime.date, str, None],
+        end_date: Union[datetime.date, str, None],
+        request_id: Optional[str],
+        timeout: int,
+    ) -> bool:
+        """Queue event for delayed inventory push, return True if the push has to be scheduled"""
+        pass
+
+    @abc.abstractmethod
+    def select_inventory_updates(self, house_id: int) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        pass
+
+    @abc.abstractmethod
+    def complete_inventory_update(self, house_id: int, count: int, timeout: int) -> bool:
+        """Drop pushed events from queue, return True if the push of events queued meanwhile has to be scheduled"""
+        pass
+
 
 class ReservationsRepo(abc.ABC):
     @abc.abstractmethod
@@ -52,6 +78,7 @@ class ReservationsRepo(abc.ABC):
         start_date: datetime.date = None,
         end_date: datetime.date = None,
         pks: List[int] = None,
+        detailed: bool = True,
     ) -> List['Reservation']:
         pass
 
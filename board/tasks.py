@@ -1,10 +1,12 @@
 import datetime
-from typing import Union
+from typing import Callable, List, Optional, TYPE_CHECKING, Tuple, Type, Union
 
+import inject
 from celery import shared_task
 from returns.pipeline import is_successful
 
 import effective_tours.dependencies  # noqa  For Dependency Injector
+from board.repositories import OccupancyRepo
 from board.usecases import (
     CalculateOccupancy,
     CancelReservationInOdoo,
@@ -13,10 +15,18 @@ from board.usecases import (
     UpdateReservationInOdoo,
 )
 from board.value_objects import ReservationErrors
+from channels import tasks as channel_tasks
 from common import functions as cf, notifications as nf
 from common.loggers import Logger
+from common.value_objects import ServiceBase
 from invoices.tasks import auto_make_invoice
 
+if TYPE_CHECKING:
+    from celery import Task
+
+INVENTORY_UPDATE_DELAY = 2  # seconds
+INVENTORY_FLUSH_TIMEOUT = 600  # seconds, next event schedules the push again if flush task is lost
+
 
 @shared_task(bind=True, name='board.calculate_occupancy', retry_kwargs={'max_retries': 2})
 def calculate_occupancy(
@@ -41,50 +51,49 @@ def calculate_occupancy(
 
 @shared_task(bind=True, name='board.cancel_reservation_in_odoo', retry_kwargs={'max_retries': 2})
 def cancel_reservation_in_odoo(self, hid: int, pk: int, user_id: int = None) -> None:
-    result = CancelReservationInOdoo().execute(hid, pk, user_id=user_id)
-    if is_successful(result):
-        auto_make_invoice.delay(pk)
-        return
-    failure = result.failure()
-    if failure.failure == ReservationErrors.room_close_reservation:
-        # It's normal case but use error just for breaking flow
-        return
-    Logger.warning(__name__, failure)
-    nf.notify_warning(f"Error cancel Reservation ID={pk} in Odoo\n{failure.short_info()}")
-    if failure.failure == ReservationErrors.error:
-        raise self.retry(exc=failure.exc)
+    run_odoo_usecase(self, CancelReservationInOdoo, 'cancel', hid, pk, user_id=user_id)
+
+
+@shared_task(bind=True, name='board.flush_inventory_update', retry_kwargs={'max_retries': 2})
+def flush_inventory_update(self, hid: int) -> None:
+    """Push inventory to OTA once for all events queued by OccupancyHandler during a burst"""
+    occupancy_repo = inject.instance(OccupancyRepo)
+    events = occupancy_repo.select_inventory_updates(hid)
+    if events:
+        starts, ends, request_ids = zip(*events)
+        try:
+            channel_tasks.update_inventory.delay(
+                hid=hid,
+                start_date=_widest_date(starts, min),
+                end_date=_widest_date(ends, max),
+                request_id=",".join(x for x in dict.fromkeys(request_ids) if x) or None,
+            )
+        except Exception as err:
+            # Events stay queued until the push is enqueued
+            Logger.warning(__name__, f"Error push inventory for House ID={hid} : {err}")
+            raise self.retry(exc=err)
+    else:
+        Logger.warning(__name__, f"No queued inventory events for House ID={hid}, they are pushed already or lost")
+    if occupancy_repo.complete_inventory_update(hid, len(events), INVENTORY_FLUSH_TIMEOUT):
+        flush_inventory_update.apply_async(args=(hid,), countdown=INVENTORY_UPDATE_DELAY)
 
 
 @shared_task(bind=True, name='board.register_reservation_in_odoo', retry_kwargs={'max_retries': 2})
 def register_reservation_in_odoo(self, hid: int, pk: int, user_id: int = None) -> None:
-    result = RegisterReservationInOdoo().execute(hid, pk, user_id=user_id)
-    if is_successful(result):
-        auto_make_invoice.delay(pk)
-        return
-    failure = result.failure()
-    if failure.failure == ReservationErrors.room_close_reservation:
-        # It's normal case but use error just for breaking flow
-        return
-    Logger.warning(__name__, failure)
-    nf.notify_warning(f"Error register Reservation ID={pk} in Odoo\n{failure.short_info()}")
-    if failure.failure in (ReservationErrors.error, ReservationErrors.save):
-        raise self.retry(exc=failure.exc)
+    run_odoo_usecase(
+        self,
+        RegisterReservationInOdoo,
+        'register',
+        hid,
+        pk,
+        user_id=user_id,
+        retry_on=(ReservationErrors.error, ReservationErrors.save),
+    )
 
 
 @shared_task(bind=True, name='board.update_reservation_in_odoo', retry_kwargs={'max_retries': 2})
 def update_reservation_in_odoo(self, hid: int, pk: int, user_id: int = None) -> None:
-    result = UpdateReservationInOdoo().execute(hid, pk, user_id=user_id)
-    if is_successful(result):
-        auto_make_invoice.delay(pk)
-        return
-    failure = result.failure()
-    if failure.failure == ReservationErrors.room_close_reservation:
-        # It's normal case but use error just for breaking flow
-        return
-    Logger.warning(__name__, failure)
-    nf.notify_warning(f"Error update Reservation ID={pk} in Odoo\n{failure.short_info()}")
-    if failure.failure == ReservationErrors.error:
-        raise self.retry(exc=failure.exc)
+    run_odoo_usecase(self, UpdateReservationInOdoo, 'update', hid, pk, user_id=user_id)
 
 
 @shared_task(bind=True, name='board.update_reservations', retry_kwargs={'max_retries': 2})
@@ -106,3 +115,37 @@ def update_reservations(
     Logger.warning(__name__, failure)
     nf.notify_warning(f"Error update reservation cache\n{failure.short_info()}")
     raise self.retry(exc=failure.exc)
+
+
+def run_odoo_usecase(
+    task: 'Task',
+    usecase_cls: Type[ServiceBase],
+    action: str,
+    hid: int,
+    pk: int,
+    user_id: int = None,
+    retry_on: Tuple[ReservationErrors, ...] = (ReservationErrors.error,),
+) -> None:
+    """Run Odoo synchronization of Reservation and retry task on given failures"""
+    result = usecase_cls().execute(hid, pk, user_id=user_id)
+    if is_successful(result):
+        auto_make_invoice.delay(pk)
+        return
+    failure = result.failure()
+    if failure.failure == ReservationErrors.room_close_reservation:
+        # It's normal case but use error just for breaking flow
+        return
+    Logger.warning(__name__, failure)
+    nf.notify_warning(f"Error {action} Reservation ID={pk} in Odoo\n{failure.short_info()}")
+    if failure.failure in retry_on:
+        raise task.retry(exc=failure.exc)
+
+
+def _widest_date(
+    values: Tuple[Optional[str], ...], func: Callable[[List[datetime.date]], datetime.date]
+) -> Optional[str]:
+    """Widest bound of the queued periods, missed bound in any event means unbounded period"""
+    dates = [cf.get_date_or_none(x) for x in values]
+    if any(x is None for x in dates):
+        return None
+    return func(dates).isoformat()
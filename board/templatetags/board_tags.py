@@ -1,16 +1,15 @@
 import datetime
+import time
 from typing import Any, Dict, List, Tuple
 
 import inject
 from django.template import Library
-from django.utils import timezone
 
 from board.permissions import Permissions
-from board.value_objects import DAY_CELL_WIDTH
+from board.value_objects import CLOSE_REASON_CHOICES, DAY_CELL_WIDTH
 from cancelations.repositories import PoliciesRepo
 from common.i18n import translate as _
 from common.loggers import Logger
-from effective_tours.constants import RoomCloseReasons
 from geo.repositories import GeoRepo
 from house_prices.entities import RatePlan
 from house_prices.permissions import Permissions as PRICE_PERMISSIONS
@@ -23,25 +22,18 @@ from members.entities import User
 
 register = Library()
 
+PHONE_CODES_CACHE_TIMEOUT = 300  # seconds
+_PHONE_CODES: Dict[str, Any] = {}  # process-local memo of select_phone_codes() : {'codes': ..., 'expires_at': ...}
+
 
 @register.simple_tag
 def calendar_content_width(days: Dict[str, list]) -> str:
     if not days:
         return "0px"
-    day_cnt = sum([len(x) for x in days.values()])
+    day_cnt = sum(map(len, days.values()))
     return f"{day_cnt * DAY_CELL_WIDTH + 1}px"
 
 
-@register.filter
-def is_holiday(day: datetime.date) -> bool:
-    return day.isoweekday() >= 6
-
-
-@register.filter
-def is_today(day: datetime.date) -> bool:
-    return day == timezone.localdate()
-
-
 @register.filter
 def day_occupancy(occupancies: Dict[datetime.date, int], day: datetime.date) -> int:
     return occupancies.get(day) or 0
@@ -55,13 +47,13 @@ def reservation_shortcut_menu(context: Dict[str, Any]) -> Dict[str, Any]:
     if house is None:
         return {}
     permissions = [
+        Permissions.RESERVATION_CREATE,
         HOUSE_PERMISSIONS.HOUSE_READ,
         HOUSE_PERMISSIONS.ROOMTYPE_READ,
         HOUSE_PERMISSIONS.ROOM_READ,
         PRICE_PERMISSIONS.PLAN_READ,
-        Permissions.RESERVATION_CREATE,
     ]
-    if not all([user.check_perms(x, house_id=house.id) for x in permissions]):
+    if not all(user.check_perms(x, house_id=house.id) for x in permissions):
         return {}
     room_types = select_room_types(house, user)
     rate_plans = select_rate_plans(house, user)
@@ -71,9 +63,9 @@ def reservation_shortcut_menu(context: Dict[str, Any]) -> Dict[str, Any]:
         'room_types': room_types,
         'rate_plans': rate_plans,
         'occupancies': [(x, f"{x} " + _('prices:page:ppl')) for x in range(1, RATES_MAX_OCCUPANCY)],
-        'phone_codes': sorted(select_phone_codes(), key=lambda x: x[0]),
+        'phone_codes': select_phone_codes(),
         'rooms': select_rooms(house, room_types),
-        'close_reasons': RoomCloseReasons.choices(),
+        'close_reasons': CLOSE_REASON_CHOICES,
         'policies': select_policies(house, rate_plans),
     }
 
@@ -101,6 +93,9 @@ def select_rate_plans(house: 'House', user: 'User', prices_repo: PricesRepo) ->
 
 @inject.autoparams('geo_repo')
 def select_phone_codes(geo_repo: GeoRepo) -> List[Tuple[str, str]]:
+    now = time.monotonic()
+    if _PHONE_CODES and _PHONE_CODES['expires_at'] > now:
+        return _PHONE_CODES['codes']
     try:
         codes = geo_repo.get_phone_codes()
     except Exception as err:
@@ -108,7 +103,14 @@ def select_phone_codes(geo_repo: GeoRepo) -> List[Tuple[str, str]]:
         return []
     if not codes:
         return []
-    return list(set([(x, f"+{x}") for x in codes]))
+    result = sorted({(x, f"+{x}") for x in codes}, key=lambda x: x[0])
+    _PHONE_CODES.update(codes=result, expires_at=now + PHONE_CODES_CACHE_TIMEOUT)
+    return result
+
+
+def reset_phone_codes() -> None:
+    """Drop memoized phone codes, the next call selects them from GeoRepo"""
+    _PHONE_CODES.clear()
 
 
 @inject.autoparams('rooms_repo')
@@ -21,27 +21,41 @@ from members.entities import Company, User
 from members.repositories import MembersRepo
 
 
-@pytest.yield_fixture(autouse=True)
+INJECTED_REPOS = (
+    ChangelogRepo,
+    ContactsRepo,
+    DiscountsRepo,
+    GeoRepo,
+    HousesRepo,
+    MembersRepo,
+    OccupancyRepo,
+    PricesRepo,
+    ReservationsCacheRepo,
+    ReservationsRepo,
+    RoomsRepo,
+    RoomTypesRepo,
+    PoliciesRepo,
+)
+
+
+def configure_inject(binder: inject.Binder) -> None:
+    for repo in INJECTED_REPOS:
+        binder.bind(repo, Mock())
+
+
+@pytest.yield_fixture(scope='session', autouse=True)
 def set_inject():
-    inject.clear_and_configure(
-        lambda x: x.bind(ChangelogRepo, Mock())
-        .bind(ContactsRepo, Mock())
-        .bind(DiscountsRepo, Mock())
-        .bind(GeoRepo, Mock())
-        .bind(HousesRepo, Mock())
-        .bind(MembersRepo, Mock())
-        .bind(OccupancyRepo, Mock())
-        .bind(PricesRepo, Mock())
-        .bind(ReservationsCacheRepo, Mock())
-        .bind(ReservationsRepo, Mock())
-        .bind(RoomsRepo, Mock())
-        .bind(RoomTypesRepo, Mock())
-        .bind(PoliciesRepo, Mock())
-    )
+    inject.clear_and_configure(configure_inject)
     yield
     inject.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_inject():
+    for repo in INJECTED_REPOS:
+        inject.instance(repo).reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture(scope='module')
 def company():
     return Company(
@@ -8,8 +8,10 @@ from django.utils import timezone
 from board.entities import Reservation, ReservationRoom
 from effective_tours.constants import ReservationSources, ReservationStatuses
 
+PRICE = Decimal(1120)
 
-@pytest.fixture()
+
+@pytest.fixture(scope='module')
 def reservation(house, room_type, rate_plan):
     checkin = datetime.date.today()
     checkout = checkin + datetime.timedelta(days=3)
@@ -24,8 +26,8 @@ def reservation(house, room_type, rate_plan):
         checkout=checkout,
         booked_at=timezone.now(),
         status=ReservationStatuses.MODIFY,
-        price=Decimal(1120),
-        netto_price=Decimal(1120),
+        price=PRICE,
+        netto_price=PRICE,
         guest_name='John',
         guest_surname='Smith',
         rooms=[
@@ -39,8 +41,8 @@ def reservation(house, room_type, rate_plan):
                 rate_plan_id=rate_plan.id,
                 adults=2,
                 children=1,
-                price=Decimal(1120),
-                netto_price=Decimal(1120)
+                price=PRICE,
+                netto_price=PRICE,
             )
         ]
     )
@@ -56,24 +58,19 @@ def test_reservation_allow_delete_for_ota(reservation):
     assert not _reservation.allow_delete()
 
 
-def test_reservation_allow_update_prices_for_new(reservation):
-    _reservation = attr.evolve(reservation, status=ReservationStatuses.NEW)
-    assert _reservation.allow_update_prices()
-
-
-def test_reservation_allow_update_prices_for_modify(reservation):
-    _reservation = attr.evolve(reservation, status=ReservationStatuses.MODIFY)
-    assert _reservation.allow_update_prices()
-
-
-def test_reservation_allow_update_prices_for_cancel(reservation):
-    _reservation = attr.evolve(reservation, status=ReservationStatuses.CANCEL)
-    assert not _reservation.allow_update_prices()
-
-
-def test_reservation_allow_update_prices_for_close(reservation):
-    _reservation = attr.evolve(reservation, status=ReservationStatuses.CLOSE)
-    assert not _reservation.allow_update_prices()
+@pytest.mark.parametrize(
+    'status,expected',
+    [
+        (ReservationStatuses.NEW, True),
+        (ReservationStatuses.MODIFY, True),
+        (ReservationStatuses.CANCEL, False),
+        (ReservationStatuses.CLOSE, False),
+    ],
+    ids=['new', 'modify', 'cancel', 'close'],
+)
+def test_reservation_allow_update_prices(reservation, status, expected):
+    _reservation = attr.evolve(reservation, status=status)
+    assert _reservation.allow_update_prices() is expected
 
 
 def test_reservation_get_guest_name(reservation):
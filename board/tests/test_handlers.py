@@ -0,0 +1,133 @@
+import datetime
+from unittest.mock import Mock
+
+import inject
+import pytest
+
+from board import tasks
+from board.handlers import OccupancyHandler
+from board.repositories import OccupancyRepo
+from channels import tasks as channel_tasks
+
+
+@pytest.fixture()
+def occupancy_repo() -> Mock:
+    return inject.instance(OccupancyRepo)
+
+
+@pytest.fixture()
+def update_inventory(monkeypatch) -> Mock:
+    update_inventory = Mock()
+    monkeypatch.setattr(channel_tasks, 'update_inventory', update_inventory)
+    return update_inventory
+
+
+@pytest.fixture()
+def flush_inventory_update(monkeypatch) -> Mock:
+    flush_inventory_update = Mock()
+    monkeypatch.setattr(tasks.flush_inventory_update, 'apply_async', flush_inventory_update)
+    return flush_inventory_update
+
+
+@pytest.fixture()
+def handler(monkeypatch) -> OccupancyHandler:
+    monkeypatch.setattr(tasks, 'calculate_occupancy', Mock())
+    monkeypatch.setattr(tasks, 'update_reservations', Mock())
+    return OccupancyHandler()
+
+
+def test_inventory_pushed_at_once(
+    handler: OccupancyHandler, occupancy_repo: Mock, update_inventory: Mock, flush_inventory_update: Mock, house
+):
+    occupancy_repo.start_inventory_update.return_value = True
+    start_date = datetime.date.today()
+    end_date = start_date + datetime.timedelta(days=2)
+
+    handler.handle('event', house_id=house.id, start_date=start_date, end_date=end_date, request_id='R1')
+    occupancy_repo.start_inventory_update.assert_called_once_with(house.id, tasks.INVENTORY_UPDATE_DELAY)
+    update_inventory.delay.assert_called_once_with(
+        hid=house.id, start_date=start_date, end_date=end_date, request_id='R1'
+    )
+    occupancy_repo.queue_inventory_update.assert_not_called()
+    flush_inventory_update.assert_not_called()
+
+
+def test_inventory_burst_coalesced(
+    handler: OccupancyHandler, occupancy_repo: Mock, update_inventory: Mock, flush_inventory_update: Mock, house
+):
+    start_date = datetime.date.today()
+    occupancy_repo.start_inventory_update.side_effect = [True, False, False]
+    occupancy_repo.queue_inventory_update.side_effect = [True, False]
+
+    handler.handle('event', house_id=house.id, start_date=start_date, end_date=start_date, request_id='R1')
+    handler.handle('event', house_id=house.id, start_date=start_date, end_date=start_date, request_id='R2')
+    handler.handle('event', house_id=house.id, request_id='R3')
+    update_inventory.delay.assert_called_once()
+    assert [x.args for x in occupancy_repo.queue_inventory_update.call_args_list] == [
+        (house.id, start_date, start_date, 'R2', tasks.INVENTORY_FLUSH_TIMEOUT),
+        (house.id, None, None, 'R3', tasks.INVENTORY_FLUSH_TIMEOUT),
+    ]
+    flush_inventory_update.assert_called_once_with(args=(house.id,), countdown=tasks.INVENTORY_UPDATE_DELAY)
+
+
+def test_flush_inventory_update_empty(
+    occupancy_repo: Mock, update_inventory: Mock, flush_inventory_update: Mock, house
+):
+    occupancy_repo.select_inventory_updates.return_value = []
+    occupancy_repo.complete_inventory_update.return_value = False
+
+    tasks.flush_inventory_update(house.id)
+    update_inventory.delay.assert_not_called()
+    occupancy_repo.complete_inventory_update.assert_called_once_with(house.id, 0, tasks.INVENTORY_FLUSH_TIMEOUT)
+    flush_inventory_update.assert_not_called()
+
+
+def test_flush_inventory_update_widens_period(
+    occupancy_repo: Mock, update_inventory: Mock, flush_inventory_update: Mock, house
+):
+    occupancy_repo.select_inventory_updates.return_value = [
+        ('2026-10-03', '2026-10-05', 'R2'),
+        ('2026-10-01', '2026-10-02', None),
+        ('2026-10-04', '2026-10-09', 'R3'),
+        ('2026-10-04', '2026-10-09', 'R2'),
+    ]
+    occupancy_repo.complete_inventory_update.return_value = False
+
+    tasks.flush_inventory_update(house.id)
+    update_inventory.delay.assert_called_once_with(
+        hid=house.id, start_date='2026-10-01', end_date='2026-10-09', request_id='R2,R3'
+    )
+    occupancy_repo.complete_inventory_update.assert_called_once_with(house.id, 4, tasks.INVENTORY_FLUSH_TIMEOUT)
+    flush_inventory_update.assert_not_called()
+
+
+def test_flush_inventory_update_unbounded(occupancy_repo: Mock, update_inventory: Mock, house):
+    occupancy_repo.select_inventory_updates.return_value = [('2026-10-03', '2026-10-05', 'R2'), (None, None, None)]
+    occupancy_repo.complete_inventory_update.return_value = False
+
+    tasks.flush_inventory_update(house.id)
+    update_inventory.delay.assert_called_once_with(hid=house.id, start_date=None, end_date=None, request_id='R2')
+
+
+def test_flush_inventory_update_reschedules_new_events(
+    occupancy_repo: Mock, update_inventory: Mock, flush_inventory_update: Mock, house
+):
+    occupancy_repo.select_inventory_updates.return_value = [('2026-10-03', '2026-10-05', 'R2')]
+    occupancy_repo.complete_inventory_update.return_value = True
+
+    tasks.flush_inventory_update(house.id)
+    update_inventory.delay.assert_called_once()
+    flush_inventory_update.assert_called_once_with(args=(house.id,), countdown=tasks.INVENTORY_UPDATE_DELAY)
+
+
+def test_flush_inventory_update_keeps_events_on_error(
+    monkeypatch, occupancy_repo: Mock, update_inventory: Mock, house
+):
+    occupancy_repo.select_inventory_updates.return_value = [('2026-10-03', '2026-10-05', 'R2')]
+    update_inventory.delay.side_effect = RuntimeError('broker is down')
+    monkeypatch.setattr(tasks.flush_inventory_update, 'retry', Mock(side_effect=RuntimeError('retry')))
+
+    with pytest.raises(RuntimeError):
+        tasks.flush_inventory_update(house.id)
+    tasks.flush_inventory_update.retry.assert_called_once()
+    occupancy_repo.complete_inventory_update.assert_not_called()
@@ -0,0 +1,19 @@
+import json
+
+from board.models import ReservationRoom
+from common import functions as cf
+
+POLICY = '{"name": "Non refundable", "items": [{"days": 3, "charge": 50.5}], "is_default": true, "notes": null}'
+
+
+def test_orjson_field_from_db_value():
+    field = ReservationRoom._meta.get_field('policy')
+
+    assert field.from_db_value(POLICY, None, None) == json.loads(POLICY)
+
+
+def test_orjson_field_from_db_value_stdlib(monkeypatch):
+    field = ReservationRoom._meta.get_field('policy')
+    monkeypatch.setattr(cf, 'orjson', None)
+
+    assert field.from_db_value(POLICY, None, None) == json.loads(POLICY)
@@ -0,0 +1,56 @@
+import datetime
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from board.implementation._occupancy_repo import OccupancyRepoRedis
+from common import cache_keys
+
+
+@pytest.fixture()
+def store() -> Mock:
+    return Mock()
+
+
+@pytest.fixture()
+def repo(store) -> OccupancyRepoRedis:
+    repo = OccupancyRepoRedis()
+    repo.get_store = Mock(return_value=store)
+    return repo
+
+
+def test_queue_inventory_update_schedules_first_event(repo: OccupancyRepoRedis, store: Mock, house):
+    pipe = store.pipeline.return_value
+    pipe.execute.return_value = [1, True]
+
+    assert repo.queue_inventory_update(house.id, datetime.date(2026, 10, 1), None, 'R1', 600) is True
+    pipe.rpush.assert_called_once_with(
+        cache_keys.inventory_update_pending(house.id), json.dumps(['2026-10-01', None, 'R1'])
+    )
+    pipe.set.assert_called_once_with(cache_keys.inventory_update_scheduled(house.id), 1, nx=True, ex=600)
+    pipe.expire.assert_not_called()
+
+
+def test_queue_inventory_update_scheduled_already(repo: OccupancyRepoRedis, store: Mock, house):
+    store.pipeline.return_value.execute.return_value = [2, None]
+
+    assert repo.queue_inventory_update(house.id, None, None, None, 600) is False
+
+
+def test_complete_inventory_update_drops_pushed_events(repo: OccupancyRepoRedis, store: Mock, house):
+    pipe = store.pipeline.return_value
+    pipe.execute.return_value = [True, 1, 0]
+
+    assert repo.complete_inventory_update(house.id, 3, 600) is False
+    pipe.ltrim.assert_called_once_with(cache_keys.inventory_update_pending(house.id), 3, -1)
+    pipe.delete.assert_called_once_with(cache_keys.inventory_update_scheduled(house.id))
+    store.set.assert_not_called()
+
+
+def test_complete_inventory_update_schedules_new_events(repo: OccupancyRepoRedis, store: Mock, house):
+    store.pipeline.return_value.execute.return_value = [True, 1, 2]
+    store.set.return_value = True
+
+    assert repo.complete_inventory_update(house.id, 3, 600) is True
+    store.set.assert_called_once_with(cache_keys.inventory_update_scheduled(house.id), 1, nx=True, ex=600)
@@ -0,0 +1,142 @@
+import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from board.implementation._reservations_cache_repo import (
+    INDEX_BUILT_MARKER,
+    PRUNE_INDEX_SCRIPT,
+    SCAN_BATCH_SIZE,
+    ReservationsCacheRepoRedis,
+)
+from board.value_objects import CachedReservation
+from common import cache_keys
+
+
+@pytest.fixture()
+def store() -> Mock:
+    return Mock()
+
+
+@pytest.fixture()
+def repo(store) -> ReservationsCacheRepoRedis:
+    repo = ReservationsCacheRepoRedis()
+    repo.get_store = Mock(return_value=store)
+    return repo
+
+
+@pytest.fixture(scope='module')
+def cached_reservation(room_type):
+    return CachedReservation(
+        pk='111-1',
+        reservation_id=111,
+        grid='roomtype',
+        grid_id=room_type.id,
+        checkin=datetime.datetime.combine(datetime.date.today(), datetime.time(14)),
+        checkout=datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1), datetime.time(11)),
+    )
+
+
+def test_save_adds_key_to_index(repo: ReservationsCacheRepoRedis, store: Mock, house, cached_reservation):
+    key = cache_keys.reservation(house.id, cached_reservation.pk)
+    pipe = store.pipeline.return_value
+    pipe.execute.return_value = [True, 1, 1]
+
+    assert repo.save(house.id, cached_reservation) is True
+    pipe.set.assert_called_once_with(key, cached_reservation.json())
+    pipe.sadd.assert_called_once_with(cache_keys.reservations_index(house.id), key)
+    store.scan_iter.assert_not_called()
+
+
+def test_save_builds_missed_index(repo: ReservationsCacheRepoRedis, store: Mock, house, cached_reservation):
+    key = cache_keys.reservation(house.id, cached_reservation.pk)
+    old_key = cache_keys.reservation(house.id, '110-1')
+    store.scan_iter.return_value = iter([old_key, key])
+    pipe = store.pipeline.return_value
+    pipe.execute.return_value = [True, 1, False]
+
+    assert repo.save(house.id, cached_reservation) is True
+    store.scan_iter.assert_called_once()
+    store.sadd.assert_called_once_with(cache_keys.reservations_index(house.id), old_key, key, INDEX_BUILT_MARKER)
+
+
+def test_search_empty_index(repo: ReservationsCacheRepoRedis, store: Mock, house):
+    store.pipeline.return_value.execute.return_value = [True, {INDEX_BUILT_MARKER}]
+
+    assert repo.search(house.id) == []
+    store.scan_iter.assert_not_called()
+    store.mget.assert_not_called()
+    store.eval.assert_not_called()
+
+
+def test_search_builds_missed_index(repo: ReservationsCacheRepoRedis, store: Mock, house, cached_reservation):
+    key = cache_keys.reservation(house.id, cached_reservation.pk)
+    store.scan_iter.return_value = iter([key])
+    store.smembers.return_value = {key}
+    store.mget.return_value = [cached_reservation.json()]
+    store.pipeline.return_value.execute.return_value = [False, set()]
+
+    assert repo.search(house.id) == [cached_reservation]
+    store.sadd.assert_called_once_with(cache_keys.reservations_index(house.id), key, INDEX_BUILT_MARKER)
+    store.mget.assert_called_once_with([key])
+
+
+def test_search_rebuilds_evicted_index(repo: ReservationsCacheRepoRedis, store: Mock, house, cached_reservation):
+    # Index was built before and then evicted with its marker, while reservations are still cached
+    key = cache_keys.reservation(house.id, cached_reservation.pk)
+    store.scan_iter.return_value = iter([key])
+    store.smembers.return_value = {key, INDEX_BUILT_MARKER}
+    store.mget.return_value = [cached_reservation.json()]
+    store.pipeline.return_value.execute.return_value = [False, set()]
+
+    assert repo.search(house.id) == [cached_reservation]
+    store.scan_iter.assert_called_once_with(match=cache_keys.reservation(house.id, '*'), count=SCAN_BATCH_SIZE)
+    store.mget.assert_called_once_with([key])
+
+
+def test_search_prunes_missed_keys(repo: ReservationsCacheRepoRedis, store: Mock, house):
+    key = cache_keys.reservation(house.id, '111-1')
+    index = cache_keys.reservations_index(house.id)
+    store.pipeline.return_value.execute.return_value = [True, {key, INDEX_BUILT_MARKER}]
+    store.mget.return_value = [None]
+
+    assert repo.search(house.id) == []
+    store.eval.assert_called_once_with(PRUNE_INDEX_SCRIPT, 2, index, key)
+    store.srem.assert_not_called()
+
+
+def test_delete_removes_keys_from_index(repo: ReservationsCacheRepoRedis, store: Mock, house):
+    key = cache_keys.reservation(house.id, '111-1')
+    index = cache_keys.reservations_index(house.id)
+    store.sismember.return_value = True
+    store.sscan_iter.return_value = iter([key])
+    pipe = store.pipeline.return_value
+
+    repo.delete(house.id, 111)
+    store.scan_iter.assert_not_called()
+    store.sscan_iter.assert_called_once_with(
+        index, match=cache_keys.reservation(house.id, '111-*'), count=SCAN_BATCH_SIZE
+    )
+    pipe.delete.assert_called_once_with(key)
+    pipe.srem.assert_called_once_with(index, key)
+
+
+def test_delete_builds_missed_index(repo: ReservationsCacheRepoRedis, store: Mock, house):
+    store.sismember.return_value = False
+    store.scan_iter.return_value = iter([])
+    store.sscan_iter.return_value = iter([])
+    pipe = store.pipeline.return_value
+
+    repo.delete(house.id, 111)
+    store.scan_iter.assert_called_once_with(match=cache_keys.reservation(house.id, '*'), count=SCAN_BATCH_SIZE)
+    store.sadd.assert_called_once_with(cache_keys.reservations_index(house.id), INDEX_BUILT_MARKER)
+    pipe.delete.assert_not_called()
+
+
+def test_search_skips_broken_values(repo: ReservationsCacheRepoRedis, store: Mock, house, cached_reservation):
+    keys = [cache_keys.reservation(house.id, '110-1'), cache_keys.reservation(house.id, cached_reservation.pk)]
+    store.pipeline.return_value.execute.return_value = [True, {INDEX_BUILT_MARKER, *keys}]
+    store.mget.side_effect = lambda x: [b'{"pk": ' if y == keys[0] else cached_reservation.json().encode() for y in x]
+
+    assert repo.search(house.id) == [cached_reservation]
+    store.eval.assert_not_called()
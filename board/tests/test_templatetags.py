@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+
+import pytest
+
+from board.templatetags import board_tags
+
+
+@pytest.fixture(autouse=True)
+def reset_phone_codes():
+    board_tags.reset_phone_codes()
+    yield
+    board_tags.reset_phone_codes()
+
+
+def test_select_phone_codes_error():
+    geo_repo = Mock(get_phone_codes=Mock(side_effect=RuntimeError('ERR')))
+
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == []
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == []
+    assert geo_repo.get_phone_codes.call_count == 2
+
+
+def test_select_phone_codes_empty():
+    geo_repo = Mock(get_phone_codes=Mock(return_value=[]))
+
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == []
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == []
+    assert geo_repo.get_phone_codes.call_count == 2
+
+
+def test_select_phone_codes_ok():
+    geo_repo = Mock(get_phone_codes=Mock(return_value=['7', '1', '7', '44']))
+
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == [('1', '+1'), ('44', '+44'), ('7', '+7')]
+
+
+def test_select_phone_codes_cached():
+    geo_repo = Mock(get_phone_codes=Mock(return_value=['7', '1']))
+
+    result = board_tags.select_phone_codes(geo_repo=geo_repo)
+    assert board_tags.select_phone_codes(geo_repo=Mock()) is result
+    geo_repo.get_phone_codes.assert_called_once()
+
+
+def test_select_phone_codes_expired(monkeypatch):
+    monkeypatch.setattr(board_tags, 'PHONE_CODES_CACHE_TIMEOUT', 0)
+    geo_repo = Mock(get_phone_codes=Mock(side_effect=[['7'], ['7', '44']]))
+
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == [('7', '+7')]
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == [('44', '+44'), ('7', '+7')]
+
+
+def test_reset_phone_codes():
+    geo_repo = Mock(get_phone_codes=Mock(side_effect=[['7'], ['1']]))
+
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == [('7', '+7')]
+    board_tags.reset_phone_codes()
+    assert board_tags.select_phone_codes(geo_repo=geo_repo) == [('1', '+1')]
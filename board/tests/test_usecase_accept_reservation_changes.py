@@ -14,6 +14,9 @@ from board.value_objects import ReservationErrors
 from channels.entities import Connection, RatePlanMapping, RoomConnection
 from effective_tours.constants import Channels, ConnectionStatuses, ReservationSources, ReservationStatuses
 
+PRICE = Decimal(1120)
+PRICE_CHANGED = Decimal(1220)
+
 
 @pytest.fixture()
 def service() -> AcceptReservationChanges:
@@ -64,8 +67,8 @@ def reservation(house, connection, room_connection, rate_plan_mapping):
         guest_name='John',
         guest_surname='Smith',
         guest_phone='+1-222-3344',
-        price=Decimal(1120),
-        netto_price=Decimal(1120),
+        price=PRICE,
+        netto_price=PRICE,
         rooms=[
             ReservationRoom(
                 id=211,
@@ -80,39 +83,20 @@ def reservation(house, connection, room_connection, rate_plan_mapping):
                 policy_original={'name': 'OLD POLICY'},
                 adults=2,
                 children=1,
-                price=Decimal(1120),
-                netto_price=Decimal(1120),
+                price=PRICE,
+                netto_price=PRICE,
                 day_prices=[
                     ReservationDay(
-                        id=311,
-                        reservation_room_id=211,
-                        day=checkin,
-                        roomtype_id=room_connection.roomtype_id,
-                        price_original=Decimal(1120),
-                        price_accepted=Decimal(1120),
-                        price_changed=Decimal(1220),
-                        currency=house.currency.code,
-                    ),
-                    ReservationDay(
-                        id=312,
+                        id=311 + i,
                         reservation_room_id=211,
-                        day=checkin + datetime.timedelta(days=1),
+                        day=checkin + datetime.timedelta(days=i),
                         roomtype_id=room_connection.roomtype_id,
-                        price_original=Decimal(1120),
-                        price_accepted=Decimal(1120),
-                        price_changed=Decimal(1220),
+                        price_original=PRICE,
+                        price_accepted=PRICE,
+                        price_changed=PRICE_CHANGED,
                         currency=house.currency.code,
-                    ),
-                    ReservationDay(
-                        id=313,
-                        reservation_room_id=211,
-                        day=checkin + datetime.timedelta(days=2),
-                        roomtype_id=room_connection.roomtype_id,
-                        price_original=Decimal(1120),
-                        price_accepted=Decimal(1120),
-                        price_changed=Decimal(1220),
-                        currency=house.currency.code,
-                    ),
+                    )
+                    for i in range(3)
                 ],
             )
         ],
@@ -194,53 +178,29 @@ def test_select_reservation_ok(service: AcceptReservationChanges, context: Conte
     assert result.unwrap().source == reservation
 
 
-def test_check_reservation_wrong_house(service: AcceptReservationChanges, context: Context, house, reservation):
+@pytest.mark.parametrize(
+    'changes',
+    [
+        {'house_id': 999},
+        {'status': ReservationStatuses.CLOSE},
+        {'status': ReservationStatuses.CANCEL},
+        {'source': ReservationSources.MANUAL},
+    ],
+    ids=['wrong_house', 'room_close', 'canceled', 'manual'],
+)
+def test_check_reservation_fail(service: AcceptReservationChanges, context: Context, house, reservation, changes):
     context.house = house
-    context.source = attr.evolve(reservation, house_id=999)
+    context.source = attr.evolve(reservation, **changes)
 
     result = service.check_reservation(context)
     assert not is_successful(result)
     assert result.failure().failure == ReservationErrors.missed_reservation
 
 
-def test_check_reservation_room_close(service: AcceptReservationChanges, context: Context, house, reservation):
+@pytest.mark.parametrize('changes', [{'is_verified': True}, {}], ids=['verified', 'ok'])
+def test_check_reservation_ok(service: AcceptReservationChanges, context: Context, house, reservation, changes):
     context.house = house
-    context.source = attr.evolve(reservation, status=ReservationStatuses.CLOSE)
-
-    result = service.check_reservation(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_reservation
-
-
-def test_check_reservation_canceled(service: AcceptReservationChanges, context: Context, house, reservation):
-    context.house = house
-    context.source = attr.evolve(reservation, status=ReservationStatuses.CANCEL)
-
-    result = service.check_reservation(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_reservation
-
-
-def test_check_reservation_manual(service: AcceptReservationChanges, context: Context, house, reservation):
-    context.house = house
-    context.source = attr.evolve(reservation, source=ReservationSources.MANUAL)
-
-    result = service.check_reservation(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_reservation
-
-
-def test_check_reservation_verified(service: AcceptReservationChanges, context: Context, house, reservation):
-    context.house = house
-    context.source = attr.evolve(reservation, is_verified=True)
-
-    result = service.check_reservation(context)
-    assert is_successful(result)
-
-
-def test_check_reservation_ok(service: AcceptReservationChanges, context: Context, house, reservation):
-    context.house = house
-    context.source = reservation
+    context.source = attr.evolve(reservation, **changes)
 
     result = service.check_reservation(context)
     assert is_successful(result)
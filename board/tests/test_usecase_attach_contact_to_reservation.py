@@ -36,6 +36,11 @@ def reservation(house, rate_plan, room_type):
     )
 
 
+@pytest.fixture(scope="module")
+def saved_reservation(reservation):
+    return attr.evolve(reservation, guest_contact_id=200, guest_contact_ids=[200])
+
+
 @pytest.fixture()
 def context(house, reservation) -> Context:
     return Context(house_id=house.id, pk=reservation.id, contact_id=200)
@@ -49,21 +54,21 @@ def test_missed_house_id(service: AttachContactToReservation, context: Context):
     assert result.failure().failure == ReservationErrors.missed_house
 
 
-def test_select_house_error(service: AttachContactToReservation, context: Context):
-    service._houses_repo = Mock(get=Mock(side_effect=RuntimeError("ERR")))
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": Nothing}, ReservationErrors.missed_house),
+    ],
+    ids=["error", "missed"],
+)
+def test_select_house_fail(service: AttachContactToReservation, context: Context, stub, failure):
+    service._houses_repo = Mock(get=Mock(**stub))
 
     result = service.select_house(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_select_house_fail(service: AttachContactToReservation, context: Context):
-    service._houses_repo = Mock(get=Mock(return_value=Nothing))
-
-    result = service.select_house(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_house
+    assert result.failure().failure == failure
+    assert result.failure().exc is stub.get("side_effect")
 
 
 def test_select_house_ok(service: AttachContactToReservation, context: Context, house):
@@ -83,23 +88,22 @@ def test_missed_reservation_id(service: AttachContactToReservation, context: Con
     assert result.failure().failure == ReservationErrors.missed_reservation
 
 
-def test_select_reservation_error(service: AttachContactToReservation, context: Context, house):
-    service._reservations_repo = Mock(get=Mock(side_effect=RuntimeError("ERR")))
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": Nothing}, ReservationErrors.missed_reservation),
+    ],
+    ids=["error", "missed"],
+)
+def test_select_reservation_fail(service: AttachContactToReservation, context: Context, house, stub, failure):
+    service._reservations_repo = Mock(get=Mock(**stub))
     context.house = house
 
     result = service.select_reservation(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_select_reservation_fail(service: AttachContactToReservation, context: Context, house):
-    service._reservations_repo = Mock(get=Mock(return_value=Nothing))
-    context.house = house
-
-    result = service.select_reservation(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_reservation
+    assert result.failure().failure == failure
+    assert result.failure().exc is stub.get("side_effect")
 
 
 def test_select_reservation_ok(service: AttachContactToReservation, context: Context, house, reservation):
@@ -128,71 +132,65 @@ def test_check_reservation_ok(service: AttachContactToReservation, context: Cont
     assert is_successful(result)
 
 
-def test_add_contact_first(service: AttachContactToReservation, context: Context, reservation):
-    context.reservation = attr.evolve(reservation, guest_contact_id=None, guest_contact_ids=[])
+@pytest.mark.parametrize(
+    "contact_id, contact_ids, expected_id, expected_ids",
+    [(None, [], 200, [200]), (10, [10], 10, [10, 200]), (10, [10, 200], 10, [10, 200])],
+    ids=["first", "not_first", "duplicated"],
+)
+def test_add_contact(
+    service: AttachContactToReservation,
+    context: Context,
+    reservation,
+    contact_id,
+    contact_ids,
+    expected_id,
+    expected_ids,
+):
+    context.reservation = attr.evolve(reservation, guest_contact_id=contact_id, guest_contact_ids=list(contact_ids))
 
     result = service.add_contact(context)
     assert is_successful(result)
-    assert result.unwrap().reservation.guest_contact_id == 200
-    assert result.unwrap().reservation.guest_contact_ids == [200]
-
-
-def test_add_contact_not_first(service: AttachContactToReservation, context: Context, reservation):
-    context.reservation = attr.evolve(reservation, guest_contact_id=10, guest_contact_ids=[10])
-
-    result = service.add_contact(context)
-    assert is_successful(result)
-    assert result.unwrap().reservation.guest_contact_id == 10
-    assert result.unwrap().reservation.guest_contact_ids == [10, 200]
-
-
-def test_add_contact_duplicated(service: AttachContactToReservation, context: Context, reservation):
-    context.reservation = attr.evolve(reservation, guest_contact_id=10, guest_contact_ids=[10, 200])
-
-    result = service.add_contact(context)
-    assert is_successful(result)
-    assert result.unwrap().reservation.guest_contact_id == 10
-    assert result.unwrap().reservation.guest_contact_ids == [10, 200]
-
-
-def test_save_error(service: AttachContactToReservation, context: Context, house, reservation):
-    service._reservations_repo = Mock(save=Mock(side_effect=RuntimeError("ERR")))
-    context.house = house
-    context.reservation = reservation
-
-    result = service.save(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_save_fail(service: AttachContactToReservation, context: Context, house, reservation):
-    service._reservations_repo = Mock(save=Mock(return_value=(Nothing, False)))
+    assert result.unwrap().reservation.guest_contact_id == expected_id
+    assert result.unwrap().reservation.guest_contact_ids == expected_ids
+
+
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": (Nothing, False)}, ReservationErrors.save),
+    ],
+    ids=["error", "not_saved"],
+)
+def test_save_fail(service: AttachContactToReservation, context: Context, house, reservation, stub, failure):
+    service._reservations_repo = Mock(save=Mock(**stub))
     context.house = house
     context.reservation = reservation
 
     result = service.save(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.save
+    assert result.failure().failure == failure
     assert result.failure().error.startswith("Error save Reservation")
+    assert result.failure().exc is stub.get("side_effect")
 
 
-def test_save_reservation_ok(service: AttachContactToReservation, context: Context, house, reservation):
-    _reservation = attr.evolve(reservation, guest_contact_id=200, guest_contact_ids=[200])
-    service._reservations_repo = Mock(save=Mock(return_value=(Some(_reservation), True)))
+def test_save_reservation_ok(
+    service: AttachContactToReservation, context: Context, house, reservation, saved_reservation
+):
+    service._reservations_repo = Mock(save=Mock(return_value=(Some(saved_reservation), True)))
     context.house = house
     context.reservation = reservation
 
     result = service.save(context)
     assert is_successful(result)
-    assert result.unwrap().reservation == _reservation
+    assert result.unwrap().reservation is saved_reservation
 
 
-def test_success(service: AttachContactToReservation, context: Context, house, reservation):
-    _reservation = attr.evolve(reservation, guest_contact_id=200, guest_contact_ids=[200])
+def test_success(service: AttachContactToReservation, context: Context, house, reservation, saved_reservation):
     service._houses_repo = Mock(get=Mock(return_value=Some(house)))
     service._reservations_repo = Mock(
-        get=Mock(return_value=Some(reservation)), save=Mock(return_value=(Some(_reservation), True))
+        get=Mock(return_value=Some(attr.evolve(reservation, guest_contact_ids=[]))),
+        save=Mock(return_value=(Some(saved_reservation), True)),
     )
 
     result = service.execute(house.id, reservation.id, 200)
@@ -81,21 +81,21 @@ def test_missed_house_id(service: CalculateNewReservation, context: Context):
     assert result.failure().failure == ReservationErrors.missed_house
 
 
-def test_select_house_error(service: CalculateNewReservation, context: Context):
-    service._houses_repo = Mock(get=Mock(side_effect=RuntimeError("ERR")))
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": Nothing}, ReservationErrors.missed_house),
+    ],
+    ids=["error", "missed"],
+)
+def test_select_house_fail(service: CalculateNewReservation, context: Context, stub, failure):
+    service._houses_repo = Mock(get=Mock(**stub))
 
     result = service.select_house(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_select_house_fail(service: CalculateNewReservation, context: Context):
-    service._houses_repo = Mock(get=Mock(return_value=Nothing))
-
-    result = service.select_house(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_house
+    assert result.failure().failure == failure
+    assert result.failure().exc is stub.get("side_effect")
 
 
 def test_select_house_ok(service: CalculateNewReservation, context: Context, house):
@@ -115,23 +115,22 @@ def test_missed_roomtype_id(service: CalculateNewReservation, context: Context,
     assert result.failure().failure == ReservationErrors.missed_roomtype
 
 
-def test_select_room_type_error(service: CalculateNewReservation, context: Context, house):
-    service._roomtypes_repo = Mock(get=Mock(side_effect=RuntimeError("ERR")))
-    context.house = house
-
-    result = service.select_room_type(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_select_room_type_fail(service: CalculateNewReservation, context: Context, house):
-    service._roomtypes_repo = Mock(get=Mock(return_value=Nothing))
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": Nothing}, ReservationErrors.missed_roomtype),
+    ],
+    ids=["error", "missed"],
+)
+def test_select_room_type_fail(service: CalculateNewReservation, context: Context, house, stub, failure):
+    service._roomtypes_repo = Mock(get=Mock(**stub))
     context.house = house
 
     result = service.select_room_type(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_roomtype
+    assert result.failure().failure == failure
+    assert result.failure().exc is stub.get("side_effect")
 
 
 def test_select_room_type_ok(service: CalculateNewReservation, context: Context, house, room_type):
@@ -152,23 +151,22 @@ def test_missed_plan_id(service: CalculateNewReservation, context: Context, hous
     assert result.failure().failure == ReservationErrors.missed_rateplan
 
 
-def test_select_rate_plan_error(service: CalculateNewReservation, context: Context, house):
-    service._prices_repo = Mock(get_plan=Mock(side_effect=RuntimeError("ERR")))
-    context.house = house
-
-    result = service.select_rate_plan(context)
-    assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.error
-    assert str(result.failure().exc) == "ERR"
-
-
-def test_select_rate_plan_fail(service: CalculateNewReservation, context: Context, house):
-    service._prices_repo = Mock(get_plan=Mock(return_value=Nothing))
+@pytest.mark.parametrize(
+    "stub, failure",
+    [
+        ({"side_effect": RuntimeError("ERR")}, ReservationErrors.error),
+        ({"return_value": Nothing}, ReservationErrors.missed_rateplan),
+    ],
+    ids=["error", "missed"],
+)
+def test_select_rate_plan_fail(service: CalculateNewReservation, context: Context, house, stub, failure):
+    service._prices_repo = Mock(get_plan=Mock(**stub))
     context.house = house
 
     result = service.select_rate_plan(context)
     assert not is_successful(result)
-    assert result.failure().failure == ReservationErrors.missed_rateplan
+    assert result.failure().failure == failure
+    assert result.failure().exc is stub.get("side_effect")
 
 
 def test_select_rate_plan_ok(service: CalculateNewReservation, context: Context, house, rate_plan):
@@ -319,8 +317,8 @@ def test_select_daily_prices_with_no_rate(service: CalculateNewReservation, cont
     result = service.select_daily_prices(context)
     assert is_successful(result)
     assert result.unwrap().prices == {
-        datetime.date.today(): None,
-        datetime.date.today() + datetime.timedelta(days=1): None,
+        context.start_date: None,
+        context.start_date + datetime.timedelta(days=1): None,
     }
 
 
@@ -345,8 +343,8 @@ def test_select_daily_prices_fail(service: CalculateNewReservation, context: Con
     result = service.select_daily_prices(context)
     assert is_successful(result)
     assert result.unwrap().prices == {
-        datetime.date.today(): None,
-        datetime.date.today() + datetime.timedelta(days=1): None,
+        context.start_date: None,
+        context.start_date + datetime.timedelta(days=1): None,
     }
 
 
@@ -380,7 +378,7 @@ def test_select_price_restrictions_error(
 def test_select_price_restrictions_ok(
     service: CalculateNewReservation, context: Context, house, room_type, rate_plan, rate
 ):
-    period = [datetime.date.today(), datetime.date.today() + datetime.timedelta(days=1)]
+    period = [context.start_date, context.start_date + datetime.timedelta(days=1)]
 
     service._prices_repo = Mock(
         select_restrictions=Mock(return_value={period[0]: Decimal(50), period[1]: Decimal(50)})
@@ -621,7 +619,7 @@ def test_check_los_discounts(
 
 
 def test_check_min_prices(service: CalculateNewReservation, context: Context, house, room_type, rate_plan, rate):
-    period = [datetime.date.today(), datetime.date.today() + datetime.timedelta(days=1)]
+    period = [context.start_date, context.start_date + datetime.timedelta(days=1)]
     context.house = house
     context.room_type = room_type
     context.rate = rate
@@ -0,0 +1,46 @@
+import datetime
+import json
+
+import pytest
+
+from board.value_objects import CachedReservation, CachedReservationTag
+from common import functions as cf
+
+
+@pytest.fixture(scope='module')
+def cached_reservation(room_type):
+    return CachedReservation(
+        pk='111-1',
+        reservation_id=111,
+        grid='roomtype',
+        grid_id=room_type.id,
+        checkin=datetime.datetime.combine(datetime.date.today(), datetime.time(14)),
+        checkout=datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1), datetime.time(11)),
+        name='Иван Петров',
+        total='1120.00',
+        tags=[CachedReservationTag(code='vip', name='VIP')],
+    )
+
+
+def test_cached_reservation_json_round_trip(cached_reservation):
+    assert CachedReservation.parse_raw(cached_reservation.json()) == cached_reservation
+
+
+def test_cached_reservation_json_round_trip_stdlib(monkeypatch, cached_reservation):
+    monkeypatch.setattr(cf, 'orjson', None)
+
+    assert CachedReservation.parse_raw(cached_reservation.json()) == cached_reservation
+
+
+@pytest.mark.skipif(cf.orjson is None, reason='orjson is not installed')
+def test_cached_reservation_json_orjson_matches_stdlib(monkeypatch, cached_reservation):
+    data = cached_reservation.json()
+    monkeypatch.setattr(cf, 'orjson', None)
+
+    assert json.loads(data) == json.loads(cached_reservation.json())
+
+
+def test_cached_reservation_json_with_options(cached_reservation):
+    data = cached_reservation.json(indent=2, sort_keys=True)
+
+    assert data == json.dumps(json.loads(cached_reservation.json()), indent=2, sort_keys=True)
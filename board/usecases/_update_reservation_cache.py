@@ -302,6 +302,7 @@ class UpdateReservationCache(HouseSelectMixin, OdooApiMixin, ServiceBase):
                 start_date=ctx.start_date,
                 end_date=ctx.end_date,
                 pks=[ctx.pk] if ctx.pk is not None else None,
+                detailed=False,
             )
             ctx.reservations = data
             return Success(ctx)
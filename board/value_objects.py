@@ -2,13 +2,16 @@ import dataclasses
 import datetime
 import enum
 import json
+import sys
 from decimal import Decimal
 from typing import Dict, List, Optional, TYPE_CHECKING
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, validator
 
+from common import functions as cf
 from common.mixins import DataContextMixin
 from common.value_objects import TPrices
+from effective_tours.constants import RoomCloseReasons
 from events import Event
 
 if TYPE_CHECKING:
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
 
 DAY_CELL_WIDTH = 36
 MAX_OCCUPANCY_PERIOD = 730  # days
+CLOSE_REASON_CHOICES = tuple(RoomCloseReasons.choices())
 
 #
 # Contexts
@@ -182,6 +186,13 @@ class CachedReservation(BaseModel):
 
     class Config:
         extra = Extra.ignore
+        json_dumps = cf.json_dumps
+        json_loads = cf.json_loads
+
+    @validator('grid', 'source', 'source_code', 'status', 'meal', 'close_reason', 'close_reason_name')
+    def intern_value(cls, value: Optional[str]) -> Optional[str]:
+        # Low-cardinality values repeat across all cached reservations of a house, share one string object
+        return sys.intern(value) if value is not None else value
 
 
 def reservation_request_dumps(data, default=None, **kwargs):
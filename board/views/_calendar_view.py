@@ -2,16 +2,16 @@ from typing import Any, Dict, List, TYPE_CHECKING, Tuple
 
 from django import http
 from django.http import Http404
+from django.utils import timezone
 from django.views.generic import TemplateView
 
 from board.permissions import Permissions
 from board.usecases import ShowCalendar
-from board.value_objects import CalendarErrors
+from board.value_objects import CLOSE_REASON_CHOICES, CalendarErrors
 from common import functions as cf
 from common.http import RenderServerError
 from common.loggers import Logger
 from common.mixins import AjaxServiceMixin
-from effective_tours.constants import RoomCloseReasons
 from houses.permissions import Permissions as HousePermissions
 
 if TYPE_CHECKING:
@@ -48,7 +48,9 @@ class CalendarView(AjaxServiceMixin, TemplateView):
         context.update(ctx.asdict())
         context['house'] = context['CURRENT_HOUSE'] = ctx.house
         context['structure'] = self.prepare_structure(ctx.room_types, ctx.rooms)
-        context['close_reasons'] = RoomCloseReasons.choices()
+        context['close_reasons'] = CLOSE_REASON_CHOICES
+        context['today'] = timezone.localdate()
+        context['holidays'] = frozenset(x for days in ctx.dates.values() for x in days if x.isoweekday() >= 6)
         try:
             context['close_rooms'] = self.prepare_close_rooms(ctx.rooms, ctx.room_types)
         except Exception as err:
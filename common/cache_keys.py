@@ -16,6 +16,22 @@ def reservation(house_id: int, reservation_id: Union[int, str]) -> str:
     return _key("RES", house_id, reservation_id)
 
 
+def reservations_index(house_id: int) -> str:
+    return _key("RES", "IDX", house_id)
+
+
+def inventory_update(house_id: int) -> str:
+    return _key("INV", "UPD", house_id)
+
+
+def inventory_update_pending(house_id: int) -> str:
+    return _key("INV", "UPD", "PENDING", house_id)
+
+
+def inventory_update_scheduled(house_id: int) -> str:
+    return _key("INV", "UPD", "SCHEDULED", house_id)
+
+
 # OLD
 
 
@@ -1,5 +1,7 @@
 from django.db import models
 
+from common import functions as cf
+
 
 class TimeableModel(models.Model):
     """Model Class with timestamp for create and update events"""
@@ -11,6 +13,18 @@ class TimeableModel(models.Model):
         abstract = True
 
 
+class OrjsonJSONField(models.JSONField):
+    """JSONField which decodes values loaded from DB with orjson, if it is installed"""
+
+    def from_db_value(self, value, expression, connection):
+        if self.decoder is not None or not isinstance(value, str):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return cf.json_loads(value)
+        except ValueError:
+            return super().from_db_value(value, expression, connection)
+
+
 class UpdatableMixin:
     """
     Mixin for adding :func:`update()` with a list of allowed fields
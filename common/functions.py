@@ -1,10 +1,11 @@
 import datetime
 import io
+import json
 import os
 import time
 from decimal import Decimal, InvalidOperation
 from email.mime.image import MIMEImage
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from dateutil import parser
 from django.conf import settings
@@ -12,6 +13,11 @@ from django.core.mail import EmailMessage, EmailMultiAlternatives
 from django.utils.crypto import get_random_string
 from returns.maybe import Maybe, Nothing, Some
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def get_config(key: str, default: Any = None) -> Any:
     """Get settings from django.conf if exists, return default otherwise"""
@@ -53,12 +59,31 @@ def get_date_or_none(value: Any, **kwargs) -> Optional[datetime.date]:
         return value
     if isinstance(value, datetime.datetime):
         return value.date()
+    if isinstance(value, str) and not kwargs:
+        try:
+            return datetime.date.fromisoformat(value)  # fast path for dates serialized by JSON/Celery
+        except ValueError:
+            pass
     try:
         return parser.parse(value, **kwargs).date()
     except (TypeError, ValueError, AttributeError):
         return None
 
 
+def json_dumps(data: Any, *, default: Callable = None, **kwargs) -> str:
+    """Serialize to JSON with orjson if it is installed, formatting options (indent etc.) go to stdlib json"""
+    if orjson is None or kwargs:
+        return json.dumps(data, default=default, **kwargs)
+    return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf8")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON with orjson if it is installed"""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
 def get_time_or_none(value: Any) -> Optional[datetime.time]:
     if isinstance(value, datetime.time):
         return value
@@ -176,7 +176,7 @@ class AjaxServiceMixin:
     def check_access(self, request: http.HttpRequest) -> bool:
         if self.permissions is None or not self.permissions:
             return True
-        return all([request.user.check_perms(x, house_id=self.kwargs.get('hid')) for x in self.permissions])  # noqa
+        return all(request.user.check_perms(x, house_id=self.kwargs.get('hid')) for x in self.permissions)  # noqa
 
     def process_usecase(self, usecase_class: Callable, *args, **kwargs) -> http.HttpResponse:
         result = usecase_class().execute(*args, **kwargs)